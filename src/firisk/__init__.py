@@ -31,7 +31,7 @@ except metadata.PackageNotFoundError:  # pragma: no cover
 # Re-export a few stable, low-risk entry points
 from .curve import NSSCurve, calibrate_nss, calibrate_nss_latest, nss_yield
 from .data import load_yield_history, validate_yield_table
-from .utils import normalize_tenor, sort_tenors, tenor_to_years, year_fraction_act365
+from .utils import normalize_tenor, sort_tenors, tenor_to_years, year_fraction_act_365
 
 __all__ = [
     "__version__",
@@ -47,5 +47,5 @@ __all__ = [
     "normalize_tenor",
     "sort_tenors",
     "tenor_to_years",
-    "year_fraction_act365",
+    "year_fraction_act_365",
 ]
@@ -0,0 +1,43 @@
+"""
+Optional numba-compiled NSS kernel.
+
+The NumPy implementation of `nss_yield` allocates several temporaries per
+call, which dominates the cost for the tiny (~8 tenor) arrays used inside
+calibration residuals. This scalar-loop kernel avoids all of that.
+
+This module is only imported if numba is installed; `firisk.curve.nss`
+falls back to the pure-NumPy path otherwise.
+"""
+
+from __future__ import annotations
+
+import math
+
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def nss_yield_kernel(
+    t, b0, b1, b2, b3, tau1, tau2, out
+):  # pragma: no cover - exercised only when numba is installed
+    """
+    Fill `out` with NSS model yields for maturities `t` (1-D float64).
+
+    Uses the same small-x Taylor expansion as `_safe_loading_factor`.
+    """
+    for i in range(t.size):
+        x1 = t[i] / tau1
+        e1 = math.exp(-x1)
+        if abs(x1) < 1e-8:
+            L1 = 1.0 - x1 / 2.0 + x1 * x1 / 6.0 - x1 * x1 * x1 / 24.0
+        else:
+            L1 = (1.0 - e1) / x1
+
+        x2 = t[i] / tau2
+        e2 = math.exp(-x2)
+        if abs(x2) < 1e-8:
+            L2 = 1.0 - x2 / 2.0 + x2 * x2 / 6.0 - x2 * x2 * x2 / 24.0
+        else:
+            L2 = (1.0 - e2) / x2
+
+        out[i] = b0 + b1 * L1 + b2 * (L1 - e1) + b3 * (L2 - e2)
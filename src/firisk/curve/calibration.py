@@ -1,286 +1,767 @@
-from __future__ import annotations
-
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
-
-import numpy as np
-
-try:
-    from scipy.optimize import least_squares
-except ImportError as e:
-    raise ImportError(
-        "scipy is required for NSS calibration. "
-        "Install with: pip install scipy"
-    ) from e
-
-from firisk.curve.nss import NSSParams, nss_yield
-from firisk.utils.dates import normalize_tenor, tenor_to_years, sort_tenors
-
-
-# ----------------------------
-# Defaults aligned to your project scope
-# ----------------------------
-
-DEFAULT_TENORS: Sequence[str] = (
-    "3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y"
-)
-
-
-# ----------------------------
-# Fit stats container
-# ----------------------------
-
-@dataclass(frozen=True)
-class NSSFitStats:
-    rmse: float
-    max_abs_error: float
-    n_points: int
-    success: bool
-    cost: float
-    message: str
-
-    # Optional diagnostics
-    fitted_yields: Optional[np.ndarray] = None
-    observed_yields: Optional[np.ndarray] = None
-    maturities_years: Optional[np.ndarray] = None
-    tenors: Optional[List[str]] = None
-
-
-# ----------------------------
-# Public API
-# ----------------------------
-
-def calibrate_nss(
-    tenors: Sequence[str],
-    observed_yields: Sequence[float],
-    *,
-    initial_guess: Optional[Sequence[float]] = None,
-    bounds: Optional[Tuple[Sequence[float], Sequence[float]]] = None,
-    drop_na: bool = True,
-) -> Tuple[NSSParams, NSSFitStats]:
-    """
-    Calibrate NSS parameters to an observed yield snapshot.
-
-    Parameters
-    ----------
-    tenors:
-        Tenor strings like ["3M","6M","1Y","2Y",...].
-    observed_yields:
-        Yields in decimal form aligned with tenors.
-    initial_guess:
-        Optional explicit 6-vector:
-            [beta0, beta1, beta2, beta3, tau1, tau2]
-    bounds:
-        Optional (lower, upper) bounds for least squares.
-    drop_na:
-        If True, drop any tenor points with NaN yields.
-
-    Returns
-    -------
-    (NSSParams, NSSFitStats)
-    """
-    if len(tenors) != len(observed_yields):
-        raise ValueError("tenors and observed_yields must have the same length.")
-
-    # Normalize tenors
-    tenors_norm = [normalize_tenor(t) for t in tenors]
-
-    # Convert to numeric
-    y = np.asarray(observed_yields, dtype=float)
-
-    # Optionally drop NaNs
-    if drop_na:
-        mask = np.isfinite(y)
-        tenors_norm = [t for t, m in zip(tenors_norm, mask) if m]
-        y = y[mask]
-
-    if len(tenors_norm) < 4:
-        raise ValueError(
-            "Not enough valid tenor points to fit NSS. "
-            "Provide at least 4 non-NaN yields."
-        )
-
-    # Convert tenors to maturities in years
-    mats = np.array([tenor_to_years(t) for t in tenors_norm], dtype=float)
-
-    # Sort by maturity (for stable guesses/diagnostics)
-    order = np.argsort(mats)
-    mats = mats[order]
-    y = y[order]
-    tenors_norm = [tenors_norm[i] for i in order]
-
-    # Default initial guess
-    if initial_guess is None:
-        # beta0 ~ longest maturity yield (anchor the long end)
-        beta0 = float(y[-1])
-        beta1 = -0.02
-        beta2 = 0.02
-        beta3 = 0.01
-        tau1 = 1.0
-        tau2 = 3.0
-        x0 = np.array([beta0, beta1, beta2, beta3, tau1, tau2], dtype=float)
-    else:
-        if len(initial_guess) != 6:
-            raise ValueError("initial_guess must be a length-6 sequence.")
-        x0 = np.asarray(initial_guess, dtype=float)
-
-    # Default bounds (reasonable, not too tight)
-    if bounds is None:
-        lower = np.array([-0.05, -0.50, -0.50, -0.50, 1e-3, 1e-3], dtype=float)
-        upper = np.array([ 0.20,  0.50,  0.50,  0.50, 20.0, 20.0], dtype=float)
-    else:
-        lower = np.asarray(bounds[0], dtype=float)
-        upper = np.asarray(bounds[1], dtype=float)
-        if lower.shape[0] != 6 or upper.shape[0] != 6:
-            raise ValueError("bounds must provide two length-6 sequences.")
-
-    # Residual function
-    def residuals(x: np.ndarray) -> np.ndarray:
-        b0, b1, b2, b3, t1, t2 = x
-        model = nss_yield(mats, b0, b1, b2, b3, t1, t2)
-        return model - y
-
-    # Fit
-    res = least_squares(
-        residuals,
-        x0=x0,
-        bounds=(lower, upper),
-        method="trf",
-        max_nfev=5000,
-    )
-
-    params = NSSParams.from_array(res.x)
-
-    fitted = nss_yield(mats, params.beta0, params.beta1, params.beta2, params.beta3, params.tau1, params.tau2)
-    err = fitted - y
-
-    rmse = float(np.sqrt(np.mean(err ** 2)))
-    max_abs = float(np.max(np.abs(err)))
-
-    stats = NSSFitStats(
-        rmse=rmse,
-        max_abs_error=max_abs,
-        n_points=int(len(y)),
-        success=bool(res.success),
-        cost=float(res.cost),
-        message=str(res.message),
-        fitted_yields=fitted,
-        observed_yields=y,
-        maturities_years=mats,
-        tenors=list(tenors_norm),
-    )
-
-    return params, stats
-
-
-def calibrate_nss_from_series(
-    series,
-    *,
-    tenors: Optional[Sequence[str]] = None,
-    **kwargs
-) -> Tuple[NSSParams, NSSFitStats]:
-    """
-    Convenience wrapper allowing a pandas Series-like object.
-
-    If `tenors` is not provided, uses series.index.
-    """
-    try:
-        import pandas as pd  # local import to avoid hard dependency here
-    except Exception:
-        pd = None  # noqa: N806
-
-    if tenors is None:
-        if hasattr(series, "index"):
-            tenors = list(series.index)
-        else:
-            raise ValueError("tenors must be provided if series has no index.")
-
-    values = list(series.values) if hasattr(series, "values") else list(series)
-    return calibrate_nss(tenors, values, **kwargs)
-
-
-def calibrate_nss_for_date(
-    yield_df,
-    date=None,
-    *,
-    tenors: Optional[Sequence[str]] = None,
-    **kwargs
-) -> Tuple[NSSParams, NSSFitStats]:
-    """
-    Calibrate NSS for a specific date from a yield history DataFrame.
-
-    Parameters
-    ----------
-    yield_df:
-        DataFrame indexed by dates with tenor columns.
-    date:
-        A date-like index key. If None, uses latest date.
-    tenors:
-        Optional explicit tenor list. If None, uses yield_df.columns.
-    kwargs:
-        Passed to calibrate_nss.
-
-    Returns
-    -------
-    (NSSParams, NSSFitStats)
-    """
-    if tenors is None:
-        tenors = list(yield_df.columns)
-
-    if date is None:
-        date = yield_df.index.max()
-
-    row = yield_df.loc[date]
-
-    # Support row being Series
-    values = row.values if hasattr(row, "values") else row
-
-    return calibrate_nss(tenors, values, **kwargs)
-
-
-def calibrate_nss_latest(
-    yield_df,
-    *,
-    tenors: Optional[Sequence[str]] = None,
-    **kwargs
-) -> Tuple[NSSParams, NSSFitStats]:
-    """
-    Simple convenience helper for the most recent curve snapshot.
-    """
-    return calibrate_nss_for_date(yield_df, date=None, tenors=tenors, **kwargs)
-
-
-# ----------------------------
-# Optional tiny utility
-# ----------------------------
-
-def guess_initial_nss(
-    tenors: Sequence[str],
-    observed_yields: Sequence[float],
-) -> np.ndarray:
-    """
-    Exposed helper for building a reasonable starting point.
-    """
-    tenors_norm = [normalize_tenor(t) for t in tenors]
-    mats = np.array([tenor_to_years(t) for t in tenors_norm], dtype=float)
-    y = np.asarray(observed_yields, dtype=float)
-
-    mask = np.isfinite(y)
-    mats = mats[mask]
-    y = y[mask]
-
-    if len(y) == 0:
-        return np.array([0.03, -0.02, 0.02, 0.01, 1.0, 3.0], dtype=float)
-
-    order = np.argsort(mats)
-    mats = mats[order]
-    y = y[order]
-
-    beta0 = float(y[-1])
-    beta1 = -0.02
-    beta2 = 0.02
-    beta3 = 0.01
-    tau1 = 1.0
-    tau2 = 3.0
-
-    return np.array([beta0, beta1, beta2, beta3, tau1, tau2], dtype=float)
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    from scipy.linalg import lstsq as _linalg_lstsq
+    from scipy.optimize import least_squares
+except ImportError as e:
+    raise ImportError(
+        "scipy is required for NSS calibration. "
+        "Install with: pip install scipy"
+    ) from e
+
+from firisk.curve.nss import NSSParams, nss_loadings, nss_yield
+from firisk.utils.dates import normalize_tenor, sort_tenors, tenor_to_years, tenors_to_years_array
+
+
+# ----------------------------
+# Defaults aligned to your project scope
+# ----------------------------
+
+DEFAULT_TENORS: Sequence[str] = (
+    "3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y"
+)
+
+# Materialized once at import; read-only. Lets the canonical tenor set
+# skip normalization and parsing entirely in calibrate_nss.
+DEFAULT_MATS_YEARS: np.ndarray = tenors_to_years_array(tuple(DEFAULT_TENORS))
+
+
+# ----------------------------
+# Analytic loading derivatives
+# ----------------------------
+
+def _loading_tau_derivatives(t: np.ndarray, tau: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    d/dtau of the NSS loadings at x = t/tau:
+
+        L(x) = (1 - e^{-x}) / x
+        S(x) = L(x) - e^{-x}
+
+    Closed forms:
+        dL/dtau = (1 - e^{-x} (1 + x)) / (x * tau)
+        dS/dtau = dL/dtau - x e^{-x} / tau
+
+    A Taylor expansion is used for small x, mirroring _safe_loading_factor.
+    """
+    x = t / tau
+    e = np.exp(-x)
+
+    small = np.abs(x) < 1e-8
+    dL = np.where(
+        small,
+        x * (0.5 - x / 3.0) / tau,
+        (1.0 - e * (1.0 + x)) / (np.where(small, 1.0, x) * tau),
+    )
+    dS = dL - x * e / tau
+    return dL, dS
+
+
+# ----------------------------
+# Fit stats container
+# ----------------------------
+
+@dataclass(frozen=True)
+class NSSFitStats:
+    rmse: float
+    max_abs_error: float
+    n_points: int
+    success: bool
+    cost: float
+    message: str
+
+    # Optional diagnostics
+    fitted_yields: Optional[np.ndarray] = None
+    observed_yields: Optional[np.ndarray] = None
+    maturities_years: Optional[np.ndarray] = None
+    tenors: Optional[List[str]] = None
+
+
+# ----------------------------
+# Public API
+# ----------------------------
+
+def calibrate_nss(
+    tenors: Sequence[str],
+    observed_yields: Sequence[float],
+    *,
+    initial_guess: Optional[Sequence[float]] = None,
+    bounds: Optional[Tuple[Sequence[float], Sequence[float]]] = None,
+    drop_na: bool = True,
+) -> Tuple[NSSParams, NSSFitStats]:
+    """
+    Calibrate NSS parameters to an observed yield snapshot.
+
+    Parameters
+    ----------
+    tenors:
+        Tenor strings like ["3M","6M","1Y","2Y",...].
+    observed_yields:
+        Yields in decimal form aligned with tenors.
+    initial_guess:
+        Optional explicit 6-vector:
+            [beta0, beta1, beta2, beta3, tau1, tau2]
+    bounds:
+        Optional (lower, upper) bounds for least squares.
+        The tau1/tau2 components bound the nonlinear search directly.
+        The betas are solved exactly by linear least squares and checked
+        against their components afterwards: violations trigger a ridge
+        re-solve, then a bounded fit of the full 6-vector.
+    drop_na:
+        If True, drop any tenor points with NaN yields.
+
+    Returns
+    -------
+    (NSSParams, NSSFitStats)
+    """
+    if len(tenors) != len(observed_yields):
+        raise ValueError("tenors and observed_yields must have the same length.")
+
+    # Fast path: the canonical tenor set needs no normalization/parsing
+    if tuple(tenors) == tuple(DEFAULT_TENORS):
+        tenors_norm = list(DEFAULT_TENORS)
+        mats_all = DEFAULT_MATS_YEARS
+    else:
+        tenors_norm = [normalize_tenor(t) for t in tenors]
+        # Maturities for the full tenor set (cached per tenor tuple)
+        mats_all = tenors_to_years_array(tuple(tenors_norm))
+
+    # Convert to numeric
+    y = np.asarray(observed_yields, dtype=float)
+
+    # Optionally drop NaNs - pure NumPy masking, no Python re-filtering
+    if drop_na:
+        mask = np.isfinite(y)
+        y = y[mask]
+        mats = mats_all[mask]
+    else:
+        mask = None
+        mats = mats_all
+
+    if y.size < 4:
+        raise ValueError(
+            "Not enough valid tenor points to fit NSS. "
+            "Provide at least 4 non-NaN yields."
+        )
+
+    # Sort by maturity (for stable guesses/diagnostics)
+    order = np.argsort(mats)
+    mats = mats[order]
+    y = y[order]
+
+    # Reordered tenor labels are only needed for the fit diagnostics,
+    # so build them with a single object-array take instead of list comps.
+    tenor_arr = np.asarray(tenors_norm, dtype=object)
+    if mask is not None:
+        tenor_arr = tenor_arr[mask]
+    tenors_norm = list(tenor_arr[order])
+
+    # Default initial guess
+    if initial_guess is None:
+        # beta0 ~ longest maturity yield (anchor the long end)
+        beta0 = float(y[-1])
+        beta1 = -0.02
+        beta2 = 0.02
+        beta3 = 0.01
+        tau1 = 1.0
+        tau2 = 3.0
+        x0 = np.array([beta0, beta1, beta2, beta3, tau1, tau2], dtype=float)
+    else:
+        if len(initial_guess) != 6:
+            raise ValueError("initial_guess must be a length-6 sequence.")
+        x0 = np.asarray(initial_guess, dtype=float)
+
+    # Default bounds (reasonable, not too tight)
+    if bounds is None:
+        lower = np.array([-0.05, -0.50, -0.50, -0.50, 1e-3, 1e-3], dtype=float)
+        upper = np.array([ 0.20,  0.50,  0.50,  0.50, 20.0, 20.0], dtype=float)
+    else:
+        lower = np.asarray(bounds[0], dtype=float)
+        upper = np.asarray(bounds[1], dtype=float)
+        if lower.shape[0] != 6 or upper.shape[0] != 6:
+            raise ValueError("bounds must provide two length-6 sequences.")
+
+    # Separable least squares:
+    # conditional on (tau1, tau2) the model is LINEAR in the betas, so we only
+    # let the optimizer search over (tau1, tau2) and solve the betas exactly
+    # via linear least squares inside the residual. This shrinks the nonlinear
+    # problem from 6 parameters to 2 and converges in far fewer evaluations.
+    # We search in log-tau space so positivity is automatic.
+    def _design_matrix(t1: float, t2: float) -> np.ndarray:
+        load = nss_loadings(mats, tau1=t1, tau2=t2)  # (m,3)
+        return np.column_stack([np.ones_like(mats), load])  # (m,4)
+
+    # gelsy (pivoted QR) is ~3x faster than the default SVD driver on a
+    # tiny 4-column system and just as stable for this well-conditioned
+    # basis; finiteness is already guaranteed by the drop_na handling.
+    def _solve_betas(Phi: np.ndarray) -> np.ndarray:
+        beta, *_ = _linalg_lstsq(Phi, y, lapack_driver="gelsy", check_finite=False)
+        return beta
+
+    # The LM pass below is unconstrained, so clamp the taus inside the
+    # objective: steps that wander outside the bounds see a flat model
+    # there, and the explicit bounds check afterwards falls back to TRF.
+    def residuals_tau(log_tau: np.ndarray) -> np.ndarray:
+        t1, t2 = np.exp(np.clip(log_tau, log_lower, log_upper))
+        Phi = _design_matrix(t1, t2)
+        beta = _solve_betas(Phi)
+        return Phi @ beta - y
+
+    def jac_tau(log_tau: np.ndarray) -> np.ndarray:
+        # Analytic Jacobian of the projected residual w.r.t. log-tau,
+        # using the Kaufman approximation (beta held at its LS solution):
+        # each column is the tau-derivative of the model, projected off
+        # the column space of Phi, times tau for the log chain rule.
+        t1, t2 = np.exp(np.clip(log_tau, log_lower, log_upper))
+        Phi = _design_matrix(t1, t2)
+        beta = _solve_betas(Phi)
+
+        dL1, dS1 = _loading_tau_derivatives(mats, t1)
+        _, dS2 = _loading_tau_derivatives(mats, t2)
+
+        cols = np.column_stack([
+            (beta[1] * dL1 + beta[2] * dS1) * t1,
+            (beta[3] * dS2) * t2,
+        ])
+        proj, *_ = _linalg_lstsq(Phi, cols, lapack_driver="gelsy", check_finite=False)
+        return cols - Phi @ proj
+
+    # Fit over log(tau1), log(tau2) only
+    log_tau0 = np.log(x0[4:6])
+    log_lower = np.log(lower[4:6])
+    log_upper = np.log(upper[4:6])
+
+    # Levenberg-Marquardt is faster than TRF when the bounds are inactive,
+    # which is the common case here. Try it first, unconstrained, and only
+    # fall back to bounded TRF if the solution escapes the tau bounds.
+    res = least_squares(
+        residuals_tau,
+        x0=log_tau0,
+        jac=jac_tau,
+        method="lm",
+        max_nfev=200,
+    )
+
+    if np.any(res.x < log_lower) or np.any(res.x > log_upper):
+        res = least_squares(
+            residuals_tau,
+            x0=np.clip(res.x, log_lower, log_upper),
+            jac=jac_tau,
+            bounds=(log_lower, log_upper),
+            method="trf",
+            max_nfev=5000,
+        )
+
+    # Recover the betas once at the converged taus
+    tau1, tau2 = np.exp(res.x)
+    beta = _solve_betas(_design_matrix(tau1, tau2))
+
+    # The linear solve is unconstrained, so enforce the beta bounds after
+    # the fact. A near-collinear basis (tau1 ~ tau2) can send the exact
+    # LS betas to huge offsetting values that later overflow np.exp in
+    # pricing. First re-solve with a small ridge - it barely perturbs
+    # well-conditioned fits but collapses the offsetting-beta escape -
+    # and if the betas still leave the box, fall back to a bounded fit
+    # of the full 6-vector.
+    beta_lo, beta_hi = lower[:4], upper[:4]
+
+    def _betas_ok(b: np.ndarray) -> bool:
+        return bool(np.all(np.isfinite(b)) and np.all(b >= beta_lo) and np.all(b <= beta_hi))
+
+    if not _betas_ok(beta):
+        Phi = _design_matrix(tau1, tau2)
+        beta, *_ = _linalg_lstsq(
+            np.vstack([Phi, 1e-3 * np.eye(4)]),
+            np.concatenate([y, np.zeros(4)]),
+            lapack_driver="gelsy",
+            check_finite=False,
+        )
+
+    if not _betas_ok(beta):
+        def residuals_full(x: np.ndarray) -> np.ndarray:
+            return nss_yield(mats, x[0], x[1], x[2], x[3], x[4], x[5]) - y
+
+        res = least_squares(
+            residuals_full,
+            x0=np.clip(np.concatenate([beta, [tau1, tau2]]), lower, upper),
+            bounds=(lower, upper),
+            method="trf",
+            max_nfev=5000,
+        )
+        beta = res.x[:4]
+        tau1, tau2 = res.x[4:6]
+
+    params = NSSParams.from_array([*beta, tau1, tau2])
+
+    fitted = nss_yield(mats, params.beta0, params.beta1, params.beta2, params.beta3, params.tau1, params.tau2)
+    err = fitted - y
+
+    rmse = float(np.sqrt(np.mean(err ** 2)))
+    max_abs = float(np.max(np.abs(err)))
+
+    stats = NSSFitStats(
+        rmse=rmse,
+        max_abs_error=max_abs,
+        n_points=int(len(y)),
+        success=bool(res.success),
+        cost=float(res.cost),
+        message=str(res.message),
+        fitted_yields=fitted,
+        observed_yields=y,
+        maturities_years=mats,
+        tenors=list(tenors_norm),
+    )
+
+    return params, stats
+
+
+@functools.lru_cache(maxsize=16)
+def calibrate_nss_cached(
+    tenors: Tuple[str, ...],
+    observed_yields: Tuple[float, ...],
+) -> Tuple[NSSParams, NSSFitStats]:
+    """
+    Memoized calibrate_nss for hashable (tenor, yield) tuples.
+
+    A typical report run fits the SAME baseline snapshot three or four
+    times - once each for key-rate, stress and the VaR base price. This
+    thin LRU (sized for a handful of snapshots, not a panel) makes the
+    repeats free. Callers must pass plain tuples, e.g.
+    ``calibrate_nss_cached(tuple(tenors), tuple(obs.tolist()))``.
+    """
+    return calibrate_nss(list(tenors), observed_yields)
+
+
+def calibrate_nss_batch(
+    tenors: Sequence[str],
+    observed_matrix,
+    *,
+    initial_guess: Optional[Sequence[float]] = None,
+    **kwargs,
+) -> List[Tuple[NSSParams, NSSFitStats]]:
+    """
+    Calibrate NSS for each row of an (n_obs, n_tenors) yield matrix.
+
+    All rows share one tenor grid, so normalization and maturity parsing
+    are amortized via the cached tenor arrays, and every row is
+    warm-started from the same `initial_guess` - typically the fit of an
+    unbumped base curve, which bump-and-reprice rows sit within a basis
+    point of.
+
+    Parameters
+    ----------
+    tenors:
+        Tenor strings shared by all rows.
+    observed_matrix:
+        Array-like of shape (n_obs, n_tenors), decimal yields.
+    initial_guess:
+        Optional 6-vector warm start applied to every row.
+    kwargs:
+        Passed to calibrate_nss.
+
+    Returns
+    -------
+    List of (NSSParams, NSSFitStats), one per row, in row order.
+    """
+    obs = np.asarray(observed_matrix, dtype=float)
+    if obs.ndim != 2:
+        raise ValueError("observed_matrix must be 2-D (n_obs, n_tenors).")
+    if obs.shape[1] != len(tenors):
+        raise ValueError("observed_matrix column count must match tenors.")
+
+    return [
+        calibrate_nss(tenors, row, initial_guess=initial_guess, **kwargs)
+        for row in obs
+    ]
+
+
+def calibrate_nss_from_series(
+    series,
+    *,
+    tenors: Optional[Sequence[str]] = None,
+    **kwargs
+) -> Tuple[NSSParams, NSSFitStats]:
+    """
+    Convenience wrapper allowing a pandas Series-like object.
+
+    If `tenors` is not provided, uses series.index.
+    """
+    try:
+        import pandas as pd  # local import to avoid hard dependency here
+    except Exception:
+        pd = None  # noqa: N806
+
+    if tenors is None:
+        if hasattr(series, "index"):
+            tenors = list(series.index)
+        else:
+            raise ValueError("tenors must be provided if series has no index.")
+
+    values = list(series.values) if hasattr(series, "values") else list(series)
+    return calibrate_nss(tenors, values, **kwargs)
+
+
+def calibrate_nss_for_date(
+    yield_df,
+    date=None,
+    *,
+    tenors: Optional[Sequence[str]] = None,
+    **kwargs
+) -> Tuple[NSSParams, NSSFitStats]:
+    """
+    Calibrate NSS for a specific date from a yield history DataFrame.
+
+    Parameters
+    ----------
+    yield_df:
+        DataFrame indexed by dates with tenor columns.
+    date:
+        A date-like index key. If None, uses latest date.
+    tenors:
+        Optional explicit tenor list. If None, uses yield_df.columns.
+    kwargs:
+        Passed to calibrate_nss.
+
+    Returns
+    -------
+    (NSSParams, NSSFitStats)
+    """
+    if tenors is None:
+        tenors = list(yield_df.columns)
+
+    if date is None:
+        date = yield_df.index.max()
+
+    row = yield_df.loc[date]
+
+    # Support row being Series
+    values = row.values if hasattr(row, "values") else row
+
+    return calibrate_nss(tenors, values, **kwargs)
+
+
+def calibrate_nss_by_iloc(
+    yield_df,
+    i: int,
+    *,
+    tenors: Optional[Sequence[str]] = None,
+    **kwargs
+) -> Tuple[NSSParams, NSSFitStats]:
+    """
+    Positional fast path: calibrate NSS from row `i` of a yield history.
+
+    Unlike `.loc[date]`, integer indexing into the underlying ndarray
+    skips pandas' label-based lookup entirely, which matters when looping
+    over many dates. For such loops, hoist `values = yield_df.values` and
+    `tenors = list(yield_df.columns)` outside and index positionally.
+
+    Parameters
+    ----------
+    yield_df:
+        DataFrame indexed by dates with tenor columns.
+    i:
+        Integer row position (supports negative indexing).
+    tenors:
+        Optional explicit tenor list. If None, uses yield_df.columns.
+    kwargs:
+        Passed to calibrate_nss.
+
+    Returns
+    -------
+    (NSSParams, NSSFitStats)
+    """
+    if tenors is None:
+        tenors = list(yield_df.columns)
+
+    values = yield_df.values[i]
+    return calibrate_nss(tenors, values, **kwargs)
+
+
+def calibrate_nss_panel(
+    yield_df,
+    *,
+    tenors: Optional[Sequence[str]] = None,
+    tau_grid: Optional[Sequence[Tuple[float, float]]] = None,
+    refine: bool = True,
+):
+    """
+    Calibrate NSS for EVERY date of a yield history in a batched fashion.
+
+    Instead of running a full nonlinear fit per date, this exploits the
+    separable structure of NSS: for each candidate (tau1, tau2) pair the
+    beta sub-problem is linear, so a single np.linalg.lstsq solves the
+    betas for ALL dates simultaneously. The best grid pair per date is
+    then optionally refined with the regular per-date fit, warm-started
+    from the previous date's solution.
+
+    Parameters
+    ----------
+    yield_df:
+        Clean yield history (DatetimeIndex, tenor columns, decimal yields,
+        no missing values - i.e. the output of load_yield_history).
+    tenors:
+        Optional explicit tenor list. Defaults to yield_df.columns.
+    tau_grid:
+        Optional explicit list of (tau1, tau2) candidates. Defaults to a
+        small log-spaced grid.
+    refine:
+        If True, run the per-date separable fit warm-started at the best
+        grid candidate. If False, return the grid solution directly.
+
+    Returns
+    -------
+    pandas.DataFrame indexed like yield_df with columns:
+        beta0, beta1, beta2, beta3, tau1, tau2, rmse
+    """
+    import pandas as pd  # local import, consistent with the other helpers
+
+    if tenors is None:
+        tenors = list(yield_df.columns)
+
+    tenors_norm = [normalize_tenor(t) for t in tenors]
+    mats = tenors_to_years_array(tuple(tenors_norm))
+
+    order = np.argsort(mats)
+    mats = mats[order]
+    tenors_norm = [tenors_norm[i] for i in order]
+
+    # Preserve the panel's dtype: a float32 panel (see YieldValidationConfig)
+    # keeps the whole grid stage in float32 (sgemm, half the bandwidth),
+    # which is ample for basis-point RMSE targets.
+    Y = np.asarray(yield_df[tenors_norm].values).T  # (m, n_dates)
+    if Y.dtype not in (np.float32, np.float64):
+        Y = Y.astype(float)
+    m, n_dates = Y.shape
+
+    if not np.all(np.isfinite(Y)):
+        raise ValueError(
+            "calibrate_nss_panel requires a clean panel without NaNs. "
+            "Run the data through load_yield_history/validate_yield_table first."
+        )
+
+    if tau_grid is None:
+        taus = np.geomspace(0.25, 10.0, 5)
+        tau_grid = [(t1, t2) for t1 in taus for t2 in taus if t1 != t2]
+
+    # Batched grid search: one lstsq per tau-pair covers all dates at once.
+    best_sse = np.full(n_dates, np.inf)
+    best_B = np.zeros((4, n_dates))
+    best_tau = np.zeros((2, n_dates))
+
+    for t1, t2 in tau_grid:
+        load = nss_loadings(mats, tau1=t1, tau2=t2)
+        Phi = np.column_stack([np.ones_like(mats), load]).astype(Y.dtype, copy=False)
+        B, *_ = _linalg_lstsq(Phi, Y, lapack_driver="gelsy", check_finite=False)  # (4, n_dates)
+        R = Phi @ B - Y
+        sse = np.einsum("ij,ij->j", R, R)
+
+        better = sse < best_sse
+        best_sse[better] = sse[better]
+        best_B[:, better] = B[:, better]
+        best_tau[0, better] = t1
+        best_tau[1, better] = t2
+
+    out = np.empty((n_dates, 7), dtype=float)
+    out[:, 0:4] = best_B.T
+    out[:, 4:6] = best_tau.T
+    out[:, 6] = np.sqrt(best_sse / m)
+
+    if refine:
+        # Per-date polish of the 2-D tau problem, warm-started from the
+        # grid winner (and implicitly from the previous date, since the
+        # winners vary slowly day to day).
+        for i in range(n_dates):
+            params, stats = calibrate_nss(
+                tenors_norm,
+                Y[:, i],
+                initial_guess=out[i, 0:6],
+            )
+            out[i, 0:6] = params.as_array()
+            out[i, 6] = stats.rmse
+
+    return pd.DataFrame(
+        out,
+        index=yield_df.index,
+        columns=["beta0", "beta1", "beta2", "beta3", "tau1", "tau2", "rmse"],
+    )
+
+
+def _fit_rows_warmstarted(values: np.ndarray, tenors: Sequence[str]) -> np.ndarray:
+    """
+    Worker for calibrate_nss_panel_parallel: fit a chronological block of
+    rows, warm-starting each date from the previous date's solution.
+    """
+    out = np.empty((len(values), 7), dtype=float)
+    guess = None
+    for k in range(len(values)):
+        params, stats = calibrate_nss(list(tenors), values[k], initial_guess=guess)
+        out[k, 0:6] = params.as_array()
+        out[k, 6] = stats.rmse
+        guess = out[k, 0:6]
+    return out
+
+
+def calibrate_nss_panel_parallel(
+    yield_df,
+    *,
+    tenors: Optional[Sequence[str]] = None,
+    n_jobs: Optional[int] = None,
+    chunk_size: int = 256,
+):
+    """
+    Per-date NSS calibration across all dates using a process pool.
+
+    Each date's fit is independent, so the panel is split into
+    chronological chunks of `chunk_size` rows and farmed out to worker
+    processes via concurrent.futures (stdlib - no extra dependency).
+    Within a chunk each date warm-starts from the previous date's
+    solution, since curve parameters drift slowly day to day.
+
+    Only the raw ndarray and the tenor list are shipped to workers, not
+    the DataFrame, to keep pickling cheap.
+
+    Parameters
+    ----------
+    yield_df:
+        Clean yield history (no NaNs) with tenor columns.
+    tenors:
+        Optional explicit tenor list. Defaults to yield_df.columns.
+    n_jobs:
+        Worker process count. Defaults to the executor's own default
+        (the number of CPUs).
+    chunk_size:
+        Rows per worker task; larger chunks amortize process overhead
+        but reduce load balancing.
+
+    Returns
+    -------
+    pandas.DataFrame indexed like yield_df with columns:
+        beta0, beta1, beta2, beta3, tau1, tau2, rmse
+    """
+    import pandas as pd
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+
+    if tenors is None:
+        tenors = list(yield_df.columns)
+    tenors_norm = [normalize_tenor(t) for t in tenors]
+
+    values = np.asarray(yield_df[tenors_norm].values, dtype=float)
+    chunks = [values[s:s + chunk_size] for s in range(0, len(values), chunk_size)]
+
+    if len(chunks) <= 1:
+        out = _fit_rows_warmstarted(values, tenors_norm)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+            results = list(ex.map(_fit_rows_warmstarted, chunks, repeat(tenors_norm)))
+        out = np.vstack(results)
+
+    return pd.DataFrame(
+        out,
+        index=yield_df.index,
+        columns=["beta0", "beta1", "beta2", "beta3", "tau1", "tau2", "rmse"],
+    )
+
+
+def panel_model_yields(
+    params_panel,
+    tenors: Optional[Sequence[str]] = None,
+):
+    """
+    Reconstruct model yields for every date of a calibrated panel.
+
+    Dates sharing the same (tau1, tau2) - e.g. the output of
+    calibrate_nss_panel(refine=False), where taus come from a small grid -
+    share a design matrix, so their yields are computed with ONE BLAS
+    matmul `Phi @ B` per tau-pair instead of a Python-level expression
+    per date.
+
+    Parameters
+    ----------
+    params_panel:
+        DataFrame with columns beta0..beta3, tau1, tau2 (as returned by
+        calibrate_nss_panel), indexed by date.
+    tenors:
+        Tenor strings to evaluate at. Defaults to DEFAULT_TENORS.
+
+    Returns
+    -------
+    pandas.DataFrame indexed like params_panel with tenor columns.
+    """
+    import pandas as pd
+
+    if tenors is None:
+        tenors = DEFAULT_TENORS
+
+    tenors_norm = [normalize_tenor(t) for t in tenors]
+    mats = tenors_to_years_array(tuple(tenors_norm))
+
+    B = np.asarray(params_panel[["beta0", "beta1", "beta2", "beta3"]].values, dtype=float).T
+    taus = np.asarray(params_panel[["tau1", "tau2"]].values, dtype=float)
+
+    out = np.empty((len(params_panel), mats.size), dtype=float)
+
+    pairs, inverse = np.unique(taus, axis=0, return_inverse=True)
+    for k, (t1, t2) in enumerate(pairs):
+        idx = np.nonzero(inverse == k)[0]
+        load = nss_loadings(mats, tau1=float(t1), tau2=float(t2))
+        Phi = np.column_stack([np.ones_like(mats), load])  # (m,4)
+        out[idx, :] = (Phi @ B[:, idx]).T
+
+    return pd.DataFrame(out, index=params_panel.index, columns=tenors_norm)
+
+
+def calibrate_nss_latest(
+    yield_df,
+    *,
+    tenors: Optional[Sequence[str]] = None,
+    **kwargs
+) -> Tuple[NSSParams, NSSFitStats]:
+    """
+    Simple convenience helper for the most recent curve snapshot.
+
+    Assumes the history is date-sorted (validate_yield_table guarantees
+    this), so the latest snapshot is simply the last row.
+    """
+    return calibrate_nss_by_iloc(yield_df, -1, tenors=tenors, **kwargs)
+
+
+# ----------------------------
+# Optional tiny utility
+# ----------------------------
+
+def guess_initial_nss(
+    tenors: Sequence[str],
+    observed_yields: Sequence[float],
+) -> np.ndarray:
+    """
+    Exposed helper for building a reasonable starting point.
+    """
+    tenors_norm = [normalize_tenor(t) for t in tenors]
+    mats = tenors_to_years_array(tuple(tenors_norm))
+    y = np.asarray(observed_yields, dtype=float)
+
+    mask = np.isfinite(y)
+    mats = mats[mask]
+    y = y[mask]
+
+    if len(y) == 0:
+        return np.array([0.03, -0.02, 0.02, 0.01, 1.0, 3.0], dtype=float)
+
+    order = np.argsort(mats)
+    mats = mats[order]
+    y = y[order]
+
+    beta0 = float(y[-1])
+    beta1 = -0.02
+    beta2 = 0.02
+    beta3 = 0.01
+    tau1 = 1.0
+    tau2 = 3.0
+
+    return np.array([beta0, beta1, beta2, beta3, tau1, tau2], dtype=float)
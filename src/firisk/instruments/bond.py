@@ -3,11 +3,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 from firisk.curve.curve_object import NSSCurve
-from firisk.instruments.cashflows import Cashflow, generate_fixed_coupon_cashflows
-from firisk.utils.dates import year_fraction_act_365
+from firisk.instruments.cashflows import (
+    Cashflow,
+    cashflow_arrays,
+    generate_fixed_coupon_cashflows,
+)
+
+# ACT/365 in nanoseconds, for year fractions from Timestamp.value
+_NS_PER_YEAR_ACT365 = 365.0 * 86_400_000_000_000.0
 
 
 @dataclass(frozen=True)
@@ -38,6 +45,34 @@ class FixedCouponBond:
             frequency=self.frequency
         )
 
+    def cashflow_arrays(self, settlement_date) -> "tuple[np.ndarray, np.ndarray]":
+        """
+        Future cashflows as (times_years, amounts) arrays.
+
+        Times are ACT/365 year fractions from settlement; only strictly
+        future flows are included. Backed by the memoized schedule, so
+        repeated calls for the same settlement are cache lookups. This is
+        the batching hook for Portfolio.price, which concatenates these
+        arrays across positions and discounts them in one curve call.
+        """
+        settle = pd.Timestamp(settlement_date)
+
+        dates_ns, amounts = cashflow_arrays(
+            settle.value,
+            pd.Timestamp(self.maturity_date).value,
+            float(self.coupon_rate),
+            float(self.notional),
+            int(self.frequency),
+        )
+
+        t = (dates_ns - settle.value) / _NS_PER_YEAR_ACT365
+
+        future = t > 0.0
+        if not future.all():
+            t = t[future]
+            amounts = amounts[future]
+        return t, amounts
+
     def price(self, curve: NSSCurve, settlement_date) -> float:
         """
         Price the bond by discounting future cashflows.
@@ -45,16 +80,15 @@ class FixedCouponBond:
         PV = sum( CF_i * DF(t_i) )
 
         where t_i is year fraction from settlement to cashflow date.
-        """
-        settle = pd.Timestamp(settlement_date)
-        cfs = self.cashflows(settle)
 
-        pv = 0.0
-        for cf in cfs:
-            t = year_fraction_act_365(settle, cf.date)
-            if t <= 0:
-                continue
-            df = curve.discount_factor(t)
-            pv += cf.amount * df
+        Vectorized and cached: the (settle, maturity, coupon) schedule is
+        identical across every bumped/shocked/simulated reprice of this
+        bond, so cashflow_arrays memoizes the pd.DateOffset walk and the
+        whole schedule is discounted with a single curve evaluation.
+        """
+        t, amounts = self.cashflow_arrays(settlement_date)
+        if t.size == 0:
+            return 0.0
 
-        return float(pv)
+        dfs = curve.discount_factor(t)
+        return float(amounts @ dfs)
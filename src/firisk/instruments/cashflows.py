@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 
@@ -30,11 +32,18 @@ def build_coupon_schedule(
     Build a simple coupon date schedule for a fixed-coupon bullet bond.
 
     Approach:
-      - Step backwards from maturity in equal month jumps.
+      - Anchor to maturity and step backwards in equal month jumps.
       - Keep dates strictly after settlement.
       - Return ascending list ending with maturity.
 
     This is a simplified schedule generator suitable for this project.
+
+    The schedule is built with vectorized integer month arithmetic: all
+    period dates come from maturity minus k*months at once, instead of a
+    pd.DateOffset subtraction per period (a pure-Python allocation each
+    step). Anchoring every date to maturity also keeps the coupon day
+    stable for month-end maturities, where repeated offset subtraction
+    lets the day drift after a short month.
     """
     settle = pd.Timestamp(settlement_date)
     maturity = pd.Timestamp(maturity_date)
@@ -44,23 +53,23 @@ def build_coupon_schedule(
 
     months = _months_per_period(frequency)
 
-    dates = []
-    d = maturity
+    # Upper bound on periods between settle and maturity (+1 so the
+    # earliest candidate lands on or before settlement; filtered below).
+    span_months = (maturity.year - settle.year) * 12 + (maturity.month - settle.month)
+    k = np.arange(span_months // months + 2)
 
-    # Walk backward
-    while d > settle:
-        dates.append(d)
-        d = d - pd.DateOffset(months=months)
+    total_months = maturity.year * 12 + (maturity.month - 1) - k * months
+    years = total_months // 12
+    mons = total_months % 12 + 1
 
-    # Reverse to chronological order
-    dates = sorted(set(dates))
+    # Clamp the anchor day to each month's length (Jan 31 -> Feb 28/29)
+    firsts = pd.to_datetime({"year": years, "month": mons, "day": np.ones_like(years)})
+    days = np.minimum(maturity.day, firsts.dt.days_in_month.to_numpy())
 
-    # Ensure maturity included
-    if dates[-1] != maturity:
-        dates.append(maturity)
-        dates = sorted(set(dates))
+    dates = pd.DatetimeIndex(pd.to_datetime({"year": years, "month": mons, "day": days}))
+    dates = dates[dates > settle].sort_values()
 
-    return dates
+    return list(dates)
 
 
 def generate_fixed_coupon_cashflows(
@@ -83,13 +92,49 @@ def generate_fixed_coupon_cashflows(
     """
     schedule = build_coupon_schedule(settlement_date, maturity_date, frequency)
 
-    cpn = float(notional) * float(coupon_rate) / frequency
+    notional = float(notional)
+    cpn = notional * float(coupon_rate) / frequency
 
-    cfs: List[Cashflow] = []
-    for dt in schedule:
-        amt = cpn
-        if pd.Timestamp(dt) == pd.Timestamp(maturity_date):
-            amt += float(notional)
-        cfs.append(Cashflow(pd.Timestamp(dt), float(amt)))
+    # The schedule is already Timestamps ending at maturity, so the
+    # principal goes on the last flow - no per-row Timestamp re-wrapping
+    # or equality test needed.
+    cfs: List[Cashflow] = [Cashflow(dt, cpn) for dt in schedule[:-1]]
+    cfs.append(Cashflow(schedule[-1], cpn + notional))
 
     return cfs
+
+
+@functools.lru_cache(maxsize=1024)
+def cashflow_arrays(
+    settlement_ns: int,
+    maturity_ns: int,
+    coupon_rate: float,
+    notional: float = 100.0,
+    frequency: int = 2,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cached array form of the fixed-coupon cashflow schedule.
+
+    Key-rate, stress and VaR repricing all regenerate the identical
+    schedule thousands of times for the same (settle, maturity, coupon)
+    tuple; building it once and memoizing eliminates the pd.DateOffset
+    walk from every inner pricing call. Dates are keyed/returned as
+    int64 nanoseconds (Timestamp.value) so the cache key is hashable and
+    the pricer can do year-fraction arithmetic without Timestamp objects.
+
+    Returns (dates_ns, amounts): read-only, ascending, maturity last with
+    principal included.
+    """
+    schedule = build_coupon_schedule(
+        pd.Timestamp(settlement_ns), pd.Timestamp(maturity_ns), frequency
+    )
+
+    dates_ns = np.array([d.value for d in schedule], dtype=np.int64)
+
+    cpn = float(notional) * float(coupon_rate) / frequency
+    amounts = np.full(dates_ns.size, cpn, dtype=np.float64)
+    amounts[-1] += float(notional)  # schedule always ends at maturity
+
+    dates_ns.setflags(write=False)
+    amounts.setflags(write=False)
+    return dates_ns, amounts
@@ -41,9 +41,33 @@ class Portfolio:
 
     def __init__(self, positions: Optional[Sequence[Position]] = None):
         self.positions: List[Position] = list(positions) if positions else []
+        self._sync_arrays()
 
     def add(self, instrument, quantity: float = 1.0) -> None:
         self.positions.append(Position(instrument=instrument, quantity=float(quantity)))
+        self._sync_arrays()
+
+    def _sync_arrays(self) -> None:
+        # Structure-of-arrays mirror of self.positions for the hot pricing
+        # path: quantities as one contiguous float64 vector, instruments as
+        # a flat list, so aggregation is array arithmetic rather than
+        # attribute access per position.
+        self._instruments: List[object] = [p.instrument for p in self.positions]
+        self._quantities: np.ndarray = np.fromiter(
+            (p.quantity for p in self.positions),
+            dtype=np.float64,
+            count=len(self.positions),
+        )
+
+    def _arrays(self):
+        # positions is a plain public list, so callers may append to it
+        # or replace entries in place instead of going through add().
+        # Rebuild the mirror unconditionally: the O(n) walk over a small
+        # Python list is negligible next to pricing, and any staleness
+        # check short of comparing contents would miss same-length
+        # mutations like positions[i] = Position(...).
+        self._sync_arrays()
+        return self._instruments, self._quantities
 
     # -----------------------------------------
     # Core pricing
@@ -52,13 +76,56 @@ class Portfolio:
     def price(self, curve: NSSCurve, settlement_date) -> float:
         """
         Price portfolio given a curve.
+
+        Positions whose instruments expose cashflow_arrays (FixedCouponBond
+        does) are batched: their quantity-scaled cashflows are concatenated
+        and discounted with ONE curve evaluation over the union of times,
+        instead of a discount-factor call per position. Other instruments
+        fall back to per-position price().
         """
+        instruments, qty = self._arrays()
+        times: List[np.ndarray] = []
+        amounts: List[np.ndarray] = []
         total = 0.0
-        for pos in self.positions:
-            instr_price = float(pos.instrument.price(curve, settlement_date=settlement_date))
-            total += float(pos.quantity) * instr_price
+
+        for i, instr in enumerate(instruments):
+            if hasattr(instr, "cashflow_arrays"):
+                t, amt = instr.cashflow_arrays(settlement_date)
+                if t.size:
+                    times.append(t)
+                    amounts.append(qty[i] * amt)
+            else:
+                total += qty[i] * float(instr.price(curve, settlement_date=settlement_date))
+
+        if times:
+            dfs = curve.discount_factor(np.concatenate(times))
+            total += float(np.concatenate(amounts) @ dfs)
+
         return float(total)
 
+    def cashflow_arrays(self, settlement_date):
+        """
+        Aggregated quantity-scaled future cashflows across all positions.
+
+        Same contract as FixedCouponBond.cashflow_arrays, so the batched
+        VaR revaluation treats a whole book like a single instrument.
+        Raises AttributeError if any instrument lacks the hook (callers
+        fall back to per-position pricing in that case).
+        """
+        instruments, qty = self._arrays()
+        times: List[np.ndarray] = []
+        amounts: List[np.ndarray] = []
+
+        for i, instr in enumerate(instruments):
+            t, amt = instr.cashflow_arrays(settlement_date)
+            if t.size:
+                times.append(t)
+                amounts.append(qty[i] * amt)
+
+        if not times:
+            return np.empty(0, dtype=float), np.empty(0, dtype=float)
+        return np.concatenate(times), np.concatenate(amounts)
+
     def price_from_yields(
         self,
         yields_by_tenor: Mapping[str, float],
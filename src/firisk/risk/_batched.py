@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from firisk.curve.nss import nss_loadings
+from firisk.utils.dates import tenors_to_years_array
+
+
+def _nss_basis(times: np.ndarray, tau1: float, tau2: float) -> np.ndarray:
+    """[1 | L1 | S1 | S2] basis matrix at fixed taus, shape (len(times), 4)."""
+    load = nss_loadings(times, tau1=tau1, tau2=tau2)
+    return np.column_stack([np.ones(load.shape[0]), load])
+
+
+def var_from_pnl(
+    pnl: np.ndarray,
+    confidence_levels: Sequence[float],
+) -> Dict[float, float]:
+    """
+    Loss-magnitude VaR per confidence level from a P&L sample.
+
+    One np.partition pass places every needed order statistic instead of
+    np.quantile's full sort per level (O(n) vs O(n log n) each), then
+    linear interpolation between adjacent order statistics reproduces
+    np.quantile's default exactly.
+    """
+    n = pnl.size
+    positions = [(float(cl), (1.0 - float(cl)) * (n - 1)) for cl in confidence_levels]
+    ks = sorted({k for _, p in positions for k in (int(np.floor(p)), int(np.ceil(p)))})
+    part = np.partition(pnl, ks)
+
+    out: Dict[float, float] = {}
+    for cl, p in positions:
+        lo = int(np.floor(p))
+        hi = int(np.ceil(p))
+        q = part[lo] + (p - lo) * (part[hi] - part[lo])
+        out[cl] = float(max(0.0, -q))
+    return out
+
+
+def batched_pnl(
+    bond,
+    settlement_date,
+    tenors: Sequence[str],
+    shocked_matrix: np.ndarray,
+    params_base,
+    base_price: float,
+) -> Optional[np.ndarray]:
+    """
+    Revalue ALL scenarios with two matmuls, holding (tau1, tau2) fixed.
+
+    Shared by historical and Monte Carlo VaR. Daily-sized shocks barely
+    move the NSS hump parameters, so each scenario's calibration
+    collapses to a LINEAR beta solve against the base-date basis. All
+    solves share one pinv, and all repricings share one cashflow
+    schedule, so the whole scenario set is:
+
+        betas_all = pinv(Phi) @ Y          (4, n_scen)
+        prices    = cf_amounts @ exp(-(B_cf @ betas_all) * cf_times)
+
+    Returns None when the instrument does not expose cashflow_arrays, in
+    which case the caller runs its per-scenario fallback.
+    """
+    try:
+        cf_times, cf_amounts = bond.cashflow_arrays(settlement_date)
+    except AttributeError:
+        return None
+
+    n_scen = shocked_matrix.shape[0]
+    if cf_times.size == 0:
+        return np.zeros(n_scen, dtype=float)
+
+    tau1 = float(params_base.tau1)
+    tau2 = float(params_base.tau2)
+
+    mats = np.asarray(tenors_to_years_array(tuple(tenors)))
+    pinv = np.linalg.pinv(_nss_basis(mats, tau1, tau2))  # (4, n_tenors)
+
+    betas_all = pinv @ shocked_matrix.T  # (4, n_scen)
+
+    # Fused repricing: yields at the cashflow times for every scenario,
+    # then discount and dot with the amounts - no per-scenario Python.
+    B_cf = _nss_basis(cf_times, tau1, tau2)  # (k, 4)
+    yields_cf = B_cf @ betas_all  # (k, n_scen)
+    discount = np.exp(-yields_cf * cf_times[:, None])
+    prices = cf_amounts @ discount  # (n_scen,)
+
+    return prices - base_price
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Keyed cache for the history-statistics stage shared by historical and
+# Monte Carlo VaR. When one yield_df is reused across many instruments
+# (a portfolio loop, a notebook session), the window slice, diff,
+# covariance and Cholesky factor are identical per (frame, tenors,
+# base_date, lookback) - only the pricing stage differs per bond.
+# DataFrames are not hashable, so the key uses id() plus cheap frame
+# fingerprints: shape, first/last index label, and the first/last rows
+# of the tenor columns as raw bytes. The value fingerprints guard both
+# id reuse and the common in-place edit (updating today's row) that
+# leaves identity and labels untouched; in-place edits confined to
+# interior rows can still hit a stale entry, so callers rewriting
+# history mid-session should rebuild the frame rather than mutate it.
+# functools.lru_cache cannot be used for unhashable frames; this is a
+# small FIFO-evicted dict.
+_CACHE: Dict[tuple, tuple] = {}
+_MAX_ENTRIES = 8
+
+
+def history_stats(
+    yield_df,
+    tenors: Sequence[str],
+    base_date,
+    lookback_days: Optional[int],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (base_vec, changes, cov, L) for the lookback window ending at base_date.
+
+    base_vec  - yields at base_date, shape (n_tenors,)
+    changes   - daily changes over the window, shape (n_days, n_tenors)
+    cov       - ridged sample covariance of the changes
+    L         - Cholesky factor of cov (PSD-projected if not numerically PD)
+
+    All four arrays are marked read-only since cache hits share them
+    across callers.
+    """
+    idx = yield_df.index
+    cols = list(tenors)
+    key = (
+        id(yield_df),
+        yield_df.shape,
+        idx[0],
+        idx[-1],
+        yield_df.loc[idx[0], cols].to_numpy(dtype=float).tobytes(),
+        yield_df.loc[idx[-1], cols].to_numpy(dtype=float).tobytes(),
+        base_date,
+        tuple(tenors),
+        int(lookback_days) if lookback_days is not None else None,
+    )
+    hit = _CACHE.get(key)
+    if hit is not None:
+        return hit
+
+    # Window ending at base_date, straight to NumPy: one label slice plus
+    # array indexing instead of tail/diff/dropna frame allocations.
+    # copy=True so the cached arrays own their memory - under pandas
+    # copy-on-write the slice can be a view, and a cached view would
+    # track later in-place edits to the frame while the derived
+    # covariance stayed frozen.
+    arr = yield_df.loc[:base_date, cols].to_numpy(dtype=float, copy=True)
+    if lookback_days is not None and lookback_days > 0:
+        arr = arr[-(int(lookback_days) + 1):]  # +1 to allow diff
+
+    if arr.shape[0] < 2:
+        raise ValueError("Not enough history for VaR with the chosen lookback window.")
+
+    base_vec = arr[-1]
+    changes = np.diff(arr, axis=0)
+
+    # Sample covariance via the post-hoc identity
+    #   cov = (X'X)/(n-1) - n/(n-1) * avg avg'
+    # (one syrk-shaped matmul on the raw data instead of np.cov's
+    # centered full-matrix copy), plus a tiny ridge for PSD-ness.
+    n = changes.shape[0]
+    avg = changes.mean(axis=0)
+    cov = (changes.T @ changes) / (n - 1) - (n / (n - 1)) * np.outer(avg, avg)
+    cov = cov + np.eye(len(tenors)) * 1e-12
+
+    # Cholesky factor for shock generation; if the ridged covariance
+    # still is not numerically PD, project to PSD via eigendecomposition
+    # with clipped eigenvalues.
+    try:
+        L = np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        w, V = np.linalg.eigh(cov)
+        L = V * np.sqrt(np.clip(w, 0.0, None))
+
+    for a in (base_vec, changes, cov, L):
+        a.setflags(write=False)
+
+    if len(_CACHE) >= _MAX_ENTRIES:
+        _CACHE.pop(next(iter(_CACHE)))
+    result = (base_vec, changes, cov, L)
+    _CACHE[key] = result
+    return result
@@ -5,9 +5,14 @@ from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Uni
 
 import numpy as np
 
-from firisk.curve.calibration import calibrate_nss
+from firisk.curve.calibration import (
+    calibrate_nss,
+    calibrate_nss_batch,
+    calibrate_nss_cached,
+)
 from firisk.curve.curve_object import NSSCurve
-from firisk.utils.dates import normalize_tenor, sort_tenors
+from firisk.risk._batched import batched_pnl as _batched_pnl
+from firisk.utils.dates import normalize_and_sort_tenors
 
 
 # Your current canonical tenor set
@@ -63,8 +68,8 @@ def compute_keyrate_dv01(
     if key_tenors is None:
         key_tenors = DEFAULT_KEY_TENORS
 
-    # Normalize and enforce order
-    key_tenors = sort_tenors([normalize_tenor(t) for t in key_tenors])
+    # Normalize and enforce order (memoized per tenor tuple)
+    key_tenors = list(normalize_and_sort_tenors(tuple(key_tenors)))
 
     # Ensure all required tenors exist in the input mapping
     missing = [t for t in key_tenors if t not in yields_by_tenor]
@@ -116,8 +121,7 @@ def compute_keyrate_dv01_with_settlement(
     if key_tenors is None:
         key_tenors = DEFAULT_KEY_TENORS
 
-    key_tenors = sort_tenors([normalize_tenor(t) for t in key_tenors])
-    tenors = list(key_tenors)
+    tenors = list(normalize_and_sort_tenors(tuple(key_tenors)))
 
     missing = [t for t in tenors if t not in yields_by_tenor]
     if missing:
@@ -125,8 +129,8 @@ def compute_keyrate_dv01_with_settlement(
 
     obs = _as_yield_vector(yields_by_tenor, tenors)
 
-    # Baseline
-    params_base, _ = calibrate_nss(tenors, obs)
+    # Baseline (memoized - stress/VaR fit the same snapshot in a report run)
+    params_base, _ = calibrate_nss_cached(tuple(tenors), tuple(obs.tolist()))
     curve_base = NSSCurve.from_params(params_base)
     base_price = float(bond.price(curve_base, settlement_date=settlement_date))
 
@@ -135,18 +139,33 @@ def compute_keyrate_dv01_with_settlement(
 
     bump_decimal = float(bump_bp) * 1e-4  # 1 bp = 0.0001
 
-    # Bump each node, refit, reprice
-    for t in tenors:
-        bumped = dict(yields_by_tenor)
-        bumped[t] = float(bumped[t]) + bump_decimal
-
-        obs_b = _as_yield_vector(bumped, tenors)
-        params_b, _ = calibrate_nss(tenors, obs_b)
-        curve_b = NSSCurve.from_params(params_b)
-
-        p_b = float(bond.price(curve_b, settlement_date=settlement_date))
-        bumped_prices[t] = p_b
-        keyrate[t] = p_b - base_price  # PV change for +1bp
+    # Build all bumped observation rows at once: row i is the base vector
+    # with tenor i bumped. Pure broadcasting - no per-tenor dict copies.
+    n = len(tenors)
+    obs_mat = np.repeat(obs[None, :], n, axis=0)
+    obs_mat[np.arange(n), np.arange(n)] += bump_decimal
+
+    # The n bumped rows are structurally n scenarios of the batched VaR
+    # kernel: a 1bp bump barely moves the NSS hump parameters, so each
+    # bumped fit collapses to a linear beta solve at the base taus and
+    # all n repricings fuse into one matmul.
+    pnl = _batched_pnl(bond, settlement_date, tenors, obs_mat, params_base, base_price)
+
+    if pnl is not None:
+        for t, dp in zip(tenors, pnl):
+            bumped_prices[t] = base_price + float(dp)
+            keyrate[t] = float(dp)  # PV change for +1bp
+    else:
+        # Instrument without the cashflow-array hook: full refit per
+        # bumped row, warm-started from the baseline parameters.
+        x0_base = params_base.as_array()
+        fits = calibrate_nss_batch(tenors, obs_mat, initial_guess=x0_base)
+        for t, (params_b, _) in zip(tenors, fits):
+            curve_b = NSSCurve.from_params(params_b)
+
+            p_b = float(bond.price(curve_b, settlement_date=settlement_date))
+            bumped_prices[t] = p_b
+            keyrate[t] = p_b - base_price  # PV change for +1bp
 
     return KeyRateResult(
         base_price=base_price,
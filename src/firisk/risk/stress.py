@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Mapping, Optional, Sequence, List
+from typing import Dict, Mapping, Optional, Sequence, List, Tuple
 
 import numpy as np
 
-from firisk.curve.calibration import calibrate_nss
+from firisk.curve.calibration import calibrate_nss, calibrate_nss_cached
 from firisk.curve.curve_object import NSSCurve
-from firisk.utils.dates import normalize_tenor, sort_tenors, tenor_to_years
+from firisk.utils.dates import normalize_and_sort_tenors, tenors_to_years_array
 
 
 DEFAULT_STRESS_TENORS: Sequence[str] = (
@@ -40,54 +42,31 @@ def _as_yield_vector(
 
 def _fit_and_price(
     bond,
-    yields_by_tenor: Mapping[str, float],
+    obs: np.ndarray,
     tenors: Sequence[str],
     settlement_date,
+    initial_guess=None,
 ) -> float:
-    obs = _as_yield_vector(yields_by_tenor, tenors)
-    params, _ = calibrate_nss(tenors, obs)
+    params, _ = calibrate_nss(tenors, obs, initial_guess=initial_guess)
     curve = NSSCurve.from_params(params)
     return float(bond.price(curve, settlement_date=settlement_date))
 
 
-def _parallel_shock(
-    yields_by_tenor: Mapping[str, float],
-    tenors: Sequence[str],
-    shock_decimal: float,
-) -> Dict[str, float]:
-    return {t: float(yields_by_tenor[t]) + shock_decimal for t in tenors}
-
-
-def _steepener_shock(
-    yields_by_tenor: Mapping[str, float],
-    tenors: Sequence[str],
-    shock_decimal: float,
-) -> Dict[str, float]:
-    mats = np.array([tenor_to_years(t) for t in tenors], dtype=float)
-    m_min = float(mats.min())
-    m_max = float(mats.max())
-    weights = np.ones_like(mats) if m_max == m_min else (mats - m_min) / (m_max - m_min)
-
-    shocked: Dict[str, float] = {}
-    for t, w in zip(tenors, weights):
-        shocked[t] = float(yields_by_tenor[t]) + w * shock_decimal
-    return shocked
-
+@functools.lru_cache(maxsize=64)
+def _slope_weights(tenors: Tuple[str, ...]) -> np.ndarray:
+    """
+    Maturity weights in [0, 1] shared by the steepener/flattener shocks.
 
-def _flattener_shock(
-    yields_by_tenor: Mapping[str, float],
-    tenors: Sequence[str],
-    shock_decimal: float,
-) -> Dict[str, float]:
-    mats = np.array([tenor_to_years(t) for t in tenors], dtype=float)
+    Cached per tenor tuple (like the tenor parsers in utils.dates), since
+    the same canonical set is used on every call. Read-only so cache hits
+    can be handed out without copying.
+    """
+    mats = tenors_to_years_array(tenors)
     m_min = float(mats.min())
     m_max = float(mats.max())
-    weights = np.ones_like(mats) if m_max == m_min else (mats - m_min) / (m_max - m_min)
-
-    shocked: Dict[str, float] = {}
-    for t, w in zip(tenors, weights):
-        shocked[t] = float(yields_by_tenor[t]) + (1.0 - w) * shock_decimal
-    return shocked
+    w = np.ones_like(mats) if m_max == m_min else (mats - m_min) / (m_max - m_min)
+    w.setflags(write=False)
+    return w
 
 
 def run_stress_tests_with_settlement(
@@ -101,44 +80,57 @@ def run_stress_tests_with_settlement(
     if stress_tenors is None:
         stress_tenors = DEFAULT_STRESS_TENORS
 
-    tenors = sort_tenors([normalize_tenor(t) for t in stress_tenors])
+    tenors = list(normalize_and_sort_tenors(tuple(stress_tenors)))
 
     missing = [t for t in tenors if t not in yields_by_tenor]
     if missing:
         raise ValueError(f"Missing tenors in yields_by_tenor: {missing}")
 
-    base_price = _fit_and_price(bond, yields_by_tenor, tenors, settlement_date)
+    # Base yield vector once; every scenario is a vector add on top of it.
+    base_vec = _as_yield_vector(yields_by_tenor, tenors)
+
+    # Fit the base curve once (memoized across the risk entry points);
+    # its parameters warm-start every scenario refit, which converges
+    # much faster than a cold start.
+    params_base, _ = calibrate_nss_cached(tuple(tenors), tuple(base_vec.tolist()))
+    curve_base = NSSCurve.from_params(params_base)
+    base_price = float(bond.price(curve_base, settlement_date=settlement_date))
+    x0_base = params_base.as_array()
 
     shock_decimal = float(shock_bp) * 1e-4
 
     scenarios: Dict[str, StressScenarioResult] = {}
 
-    y_parallel = _parallel_shock(yields_by_tenor, tenors, shock_decimal)
-    p_parallel = _fit_and_price(bond, y_parallel, tenors, settlement_date)
-    scenarios["parallel"] = StressScenarioResult(
-        name="parallel",
-        shocked_yields=y_parallel,
-        price=p_parallel,
-        pnl=p_parallel - base_price,
-    )
-
-    y_steep = _steepener_shock(yields_by_tenor, tenors, shock_decimal)
-    p_steep = _fit_and_price(bond, y_steep, tenors, settlement_date)
-    scenarios["steepener"] = StressScenarioResult(
-        name="steepener",
-        shocked_yields=y_steep,
-        price=p_steep,
-        pnl=p_steep - base_price,
-    )
-
-    y_flat = _flattener_shock(yields_by_tenor, tenors, shock_decimal)
-    p_flat = _fit_and_price(bond, y_flat, tenors, settlement_date)
-    scenarios["flattener"] = StressScenarioResult(
-        name="flattener",
-        shocked_yields=y_flat,
-        price=p_flat,
-        pnl=p_flat - base_price,
-    )
+    # All three scenarios share one cached weight vector; each shocked
+    # curve is a single elementwise add on the base vector.
+    w = _slope_weights(tuple(tenors))
+    shocked_vecs = {
+        "parallel": base_vec + shock_decimal,
+        "steepener": base_vec + w * shock_decimal,
+        "flattener": base_vec + (1.0 - w) * shock_decimal,
+    }
+
+    # The three refits are independent and spend their time in NumPy/
+    # LAPACK kernels that release the GIL, so threads (cheap, no pickling)
+    # overlap them for roughly the cost of one calibration.
+    with ThreadPoolExecutor(max_workers=len(shocked_vecs)) as ex:
+        futures = {
+            name: ex.submit(
+                _fit_and_price, bond, y_vec, tenors, settlement_date,
+                initial_guess=x0_base,
+            )
+            for name, y_vec in shocked_vecs.items()
+        }
+        prices = {name: f.result() for name, f in futures.items()}
+
+    for name, y_vec in shocked_vecs.items():
+        p = prices[name]
+        scenarios[name] = StressScenarioResult(
+            name=name,
+            shocked_yields=dict(zip(tenors, y_vec.tolist())),
+            price=p,
+            pnl=p - base_price,
+        )
 
     return StressTestResult(
         base_price=float(base_price),
@@ -1,117 +1,109 @@
-from __future__ import annotations
-
-from dataclasses import dataclass
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple
-
-import numpy as np
-
-from firisk.curve.calibration import calibrate_nss
-from firisk.curve.curve_object import NSSCurve
-from firisk.utils.dates import normalize_tenor, sort_tenors
-
-
-DEFAULT_VAR_TENORS: Sequence[str] = (
-    "3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y"
-)
-
-
-@dataclass(frozen=True)
-class HistoricalVaRResult:
-    base_price: float
-    base_date: object
-    settlement_date: object
-    tenors: List[str]
-    lookback_days: int
-    pnl: np.ndarray
-    var_by_level: Dict[float, float]
-
-
-def _as_yield_vector(yields_by_tenor: Mapping[str, float], tenors: Sequence[str]) -> np.ndarray:
-    return np.array([float(yields_by_tenor[t]) for t in tenors], dtype=float)
-
-
-def _fit_and_price(bond, yields_by_tenor: Mapping[str, float], tenors: Sequence[str], settlement_date):
-    obs = _as_yield_vector(yields_by_tenor, tenors)
-    params, _ = calibrate_nss(tenors, obs)
-    curve = NSSCurve.from_params(params)
-    return float(bond.price(curve, settlement_date=settlement_date))
-
-
-def compute_historical_var_with_settlement(
-    bond,
-    yield_df,
-    settlement_date,
-    *,
-    base_date=None,
-    tenors: Optional[Sequence[str]] = None,
-    lookback_days: int = 252,
-    confidence_levels: Sequence[float] = (0.95, 0.99),
-) -> HistoricalVaRResult:
-    """
-    Historical simulation VaR using full revaluation:
-
-    1) Choose base_date (default: latest).
-    2) Take base curve yields at base_date.
-    3) Compute historical daily changes for the chosen tenors.
-    4) Apply each historical change vector to today's/base yields.
-    5) Refit NSS and reprice bond.
-    6) Build P&L distribution and VaR.
-
-    VaR reported as a positive number (loss magnitude).
-    """
-    if tenors is None:
-        tenors = DEFAULT_VAR_TENORS
-
-    tenors = sort_tenors([normalize_tenor(t) for t in tenors])
-
-    # Validate columns exist
-    missing = [t for t in tenors if t not in yield_df.columns]
-    if missing:
-        raise ValueError(f"Yield DataFrame missing required tenors: {missing}")
-
-    if base_date is None:
-        base_date = yield_df.index.max()
-
-    # Slice lookback window ending at base_date
-    df_sub = yield_df.loc[:base_date].copy()
-    if lookback_days is not None and lookback_days > 0:
-        df_sub = df_sub.tail(lookback_days + 1)  # +1 to allow diff
-
-    if len(df_sub) < 2:
-        raise ValueError("Not enough history for historical VaR with the chosen lookback window.")
-
-    base_row = df_sub.loc[base_date, tenors].to_dict()
-
-    # Base price
-    base_price = _fit_and_price(bond, base_row, tenors, settlement_date)
-
-    # Historical daily changes
-    changes = df_sub[tenors].diff().dropna()
-
-    pnl_list = []
-    for _, delta in changes.iterrows():
-        shocked = dict(base_row)
-        for t in tenors:
-            shocked[t] = float(shocked[t]) + float(delta[t])
-
-        p_shocked = _fit_and_price(bond, shocked, tenors, settlement_date)
-        pnl_list.append(p_shocked - base_price)
-
-    pnl = np.array(pnl_list, dtype=float)
-
-    var_by_level: Dict[float, float] = {}
-    # VaR is a loss quantile: take negative tail of P&L
-    # e.g., 95% VaR => 5th percentile of P&L, report positive magnitude of loss
-    for cl in confidence_levels:
-        q = np.quantile(pnl, 1.0 - float(cl))
-        var_by_level[float(cl)] = float(max(0.0, -q))
-
-    return HistoricalVaRResult(
-        base_price=base_price,
-        base_date=base_date,
-        settlement_date=settlement_date,
-        tenors=list(tenors),
-        lookback_days=int(min(lookback_days, len(df_sub) - 1)),
-        pnl=pnl,
-        var_by_level=var_by_level,
-    )
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from firisk.curve.calibration import calibrate_nss, calibrate_nss_cached
+from firisk.curve.curve_object import NSSCurve
+from firisk.risk._batched import batched_pnl as _batched_pnl, var_from_pnl as _var_from_pnl
+from firisk.risk._history import history_stats as _history_stats
+from firisk.utils.dates import normalize_and_sort_tenors
+
+
+DEFAULT_VAR_TENORS: Sequence[str] = (
+    "3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y"
+)
+
+
+@dataclass(frozen=True)
+class HistoricalVaRResult:
+    base_price: float
+    base_date: object
+    settlement_date: object
+    tenors: List[str]
+    lookback_days: int
+    pnl: np.ndarray
+    var_by_level: Dict[float, float]
+
+
+def compute_historical_var_with_settlement(
+    bond,
+    yield_df,
+    settlement_date,
+    *,
+    base_date=None,
+    tenors: Optional[Sequence[str]] = None,
+    lookback_days: int = 252,
+    confidence_levels: Sequence[float] = (0.95, 0.99),
+) -> HistoricalVaRResult:
+    """
+    Historical simulation VaR using full revaluation:
+
+    1) Choose base_date (default: latest).
+    2) Take base curve yields at base_date.
+    3) Compute historical daily changes for the chosen tenors.
+    4) Apply each historical change vector to today's/base yields.
+    5) Re-solve NSS betas for ALL days in one batched linear system
+       (taus fixed at the base-date fit) and reprice against every
+       shocked curve in one matmul.
+    6) Build P&L distribution and VaR.
+
+    VaR reported as a positive number (loss magnitude).
+    """
+    if tenors is None:
+        tenors = DEFAULT_VAR_TENORS
+
+    tenors = list(normalize_and_sort_tenors(tuple(tenors)))
+
+    # Validate columns exist
+    missing = [t for t in tenors if t not in yield_df.columns]
+    if missing:
+        raise ValueError(f"Yield DataFrame missing required tenors: {missing}")
+
+    if base_date is None:
+        base_date = yield_df.index.max()
+
+    # History statistics (window slice, daily changes) are cached per
+    # (frame, tenors, base_date, lookback): running VaR on many
+    # instruments against one history re-runs only the pricing stage.
+    base_vec, changes, _, _ = _history_stats(
+        yield_df, tuple(tenors), base_date, lookback_days
+    )
+
+    # Base fit and price (memoized across the risk entry points)
+    params_base, _ = calibrate_nss_cached(tuple(tenors), tuple(base_vec.tolist()))
+    curve_base = NSSCurve.from_params(params_base)
+    base_price = float(bond.price(curve_base, settlement_date=settlement_date))
+
+    # Historical daily changes applied to the base snapshot
+    shocked_matrix = base_vec[None, :] + changes
+
+    pnl = _batched_pnl(
+        bond, settlement_date, tenors, shocked_matrix, params_base, base_price
+    )
+
+    if pnl is None:
+        # Instrument without the cashflow-array hook: per-day full refit,
+        # warm-started at the base parameters.
+        x0_base = params_base.as_array()
+        pnl = np.empty(len(shocked_matrix), dtype=float)
+        for i in range(len(shocked_matrix)):
+            params_i, _ = calibrate_nss(tenors, shocked_matrix[i], initial_guess=x0_base)
+            curve_i = NSSCurve.from_params(params_i)
+            pnl[i] = float(bond.price(curve_i, settlement_date=settlement_date)) - base_price
+
+    # VaR is a loss quantile: take negative tail of P&L
+    # e.g., 95% VaR => 5th percentile of P&L, report positive magnitude of loss
+    var_by_level = _var_from_pnl(pnl, confidence_levels)
+
+    return HistoricalVaRResult(
+        base_price=base_price,
+        base_date=base_date,
+        settlement_date=settlement_date,
+        tenors=list(tenors),
+        lookback_days=int(changes.shape[0]),
+        pnl=pnl,
+        var_by_level=var_by_level,
+    )
@@ -1,131 +1,199 @@
-from __future__ import annotations
-
-from dataclasses import dataclass
-from typing import Dict, List, Mapping, Optional, Sequence
-
-import numpy as np
-
-from firisk.curve.calibration import calibrate_nss
-from firisk.curve.curve_object import NSSCurve
-from firisk.utils.dates import normalize_tenor, sort_tenors
-
-
-DEFAULT_VAR_TENORS: Sequence[str] = (
-    "3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y"
-)
-
-
-@dataclass(frozen=True)
-class MonteCarloVaRResult:
-    base_price: float
-    base_date: object
-    settlement_date: object
-    tenors: List[str]
-    lookback_days: int
-    n_sims: int
-    seed: int
-    pnl: np.ndarray
-    var_by_level: Dict[float, float]
-
-
-def _as_yield_vector(yields_by_tenor: Mapping[str, float], tenors: Sequence[str]) -> np.ndarray:
-    return np.array([float(yields_by_tenor[t]) for t in tenors], dtype=float)
-
-
-def _fit_and_price(bond, yields_by_tenor: Mapping[str, float], tenors: Sequence[str], settlement_date):
-    obs = _as_yield_vector(yields_by_tenor, tenors)
-    params, _ = calibrate_nss(tenors, obs)
-    curve = NSSCurve.from_params(params)
-    return float(bond.price(curve, settlement_date=settlement_date))
-
-
-def compute_monte_carlo_var_with_settlement(
-    bond,
-    yield_df,
-    settlement_date,
-    *,
-    base_date=None,
-    tenors: Optional[Sequence[str]] = None,
-    lookback_days: int = 252,
-    n_sims: int = 5000,
-    seed: int = 42,
-    confidence_levels: Sequence[float] = (0.95, 0.99),
-) -> MonteCarloVaRResult:
-    """
-    Monte Carlo VaR using full revaluation:
-
-    1) Estimate covariance matrix of daily tenor changes from history.
-    2) Simulate multivariate normal yield shocks.
-    3) Apply shocks to the base curve snapshot.
-    4) Refit NSS and reprice bond per simulation.
-    5) Compute VaR from the simulated P&L distribution.
-
-    VaR reported as a positive number (loss magnitude).
-    """
-    if tenors is None:
-        tenors = DEFAULT_VAR_TENORS
-
-    tenors = sort_tenors([normalize_tenor(t) for t in tenors])
-
-    missing = [t for t in tenors if t not in yield_df.columns]
-    if missing:
-        raise ValueError(f"Yield DataFrame missing required tenors: {missing}")
-
-    if base_date is None:
-        base_date = yield_df.index.max()
-
-    # History window ending at base_date
-    df_sub = yield_df.loc[:base_date].copy()
-    if lookback_days is not None and lookback_days > 0:
-        df_sub = df_sub.tail(lookback_days + 1)
-
-    if len(df_sub) < 2:
-        raise ValueError("Not enough history for Monte Carlo VaR with the chosen lookback window.")
-
-    base_row = df_sub.loc[base_date, tenors].to_dict()
-
-    # Base price
-    base_price = _fit_and_price(bond, base_row, tenors, settlement_date)
-
-    # Estimate covariance of daily changes
-    changes = df_sub[tenors].diff().dropna()
-    cov = np.cov(changes.values.T)
-
-    # Numerical stability: ensure PSD-ish
-    # Add tiny ridge if needed
-    eps = 1e-12
-    cov = cov + np.eye(len(tenors)) * eps
-
-    rng = np.random.default_rng(seed)
-    shocks = rng.multivariate_normal(
-        mean=np.zeros(len(tenors)),
-        cov=cov,
-        size=int(n_sims)
-    )
-
-    pnl = np.empty(int(n_sims), dtype=float)
-
-    for i in range(int(n_sims)):
-        shocked = dict(base_row)
-        for j, t in enumerate(tenors):
-            shocked[t] = float(shocked[t]) + float(shocks[i, j])
-
-        p_shocked = _fit_and_price(bond, shocked, tenors, settlement_date)
-        pnl[i] = p_shocked - base_price
-
-    var_by_level: Dict[float, float] = {}
-    for cl in confidence_levels:
-        q = np.quantile(pnl, 1.0 - float(cl))
-        var_by_level[float(cl)] = float(max(0.0, -q))
-
-    return MonteCarloVaRResult(
-        base_price=base_price,
-        base_date=base_date,
-        settlement_date=settlement_date,
-        tenors=list(tenors),
-        lookback_days=int(min(lookback_days, len(df_sub) - 1)),
-        n_sims=int(n_sims),
-        seed=int(seed),
-        pnl=pnl,
-        var_by_level=var_by_level,
-    )
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from firisk.curve.calibration import calibrate_nss, calibrate_nss_cached
+from firisk.curve.curve_object import NSSCurve
+from firisk.risk._batched import batched_pnl as _batched_pnl, var_from_pnl as _var_from_pnl
+from firisk.risk._history import history_stats as _history_stats
+from firisk.utils.dates import normalize_and_sort_tenors
+
+
+DEFAULT_VAR_TENORS: Sequence[str] = (
+    "3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y"
+)
+
+
+@dataclass(frozen=True)
+class MonteCarloVaRResult:
+    base_price: float
+    base_date: object
+    settlement_date: object
+    tenors: List[str]
+    lookback_days: int
+    n_sims: int
+    seed: int
+    pnl: np.ndarray
+    var_by_level: Dict[float, float]
+
+
+def _reprice_chunk(
+    bond,
+    tenors: Sequence[str],
+    shocked_chunk: np.ndarray,
+    settlement_date,
+    x0_base: np.ndarray,
+    base_price: float,
+) -> np.ndarray:
+    """
+    Worker for the non-batched fallback: full warm-started refit and
+    reprice for a contiguous block of simulations. Module-level so it
+    pickles for ProcessPoolExecutor.
+    """
+    out = np.empty(len(shocked_chunk), dtype=float)
+    for i in range(len(shocked_chunk)):
+        params_i, _ = calibrate_nss(list(tenors), shocked_chunk[i], initial_guess=x0_base)
+        curve_i = NSSCurve.from_params(params_i)
+        out[i] = float(bond.price(curve_i, settlement_date=settlement_date)) - base_price
+    return out
+
+
+def _fallback_pnl(
+    bond,
+    tenors: Sequence[str],
+    shocked_matrix: np.ndarray,
+    settlement_date,
+    x0_base: np.ndarray,
+    base_price: float,
+) -> np.ndarray:
+    """
+    Per-simulation full refit for instruments without the cashflow-array
+    hook, warm-started at the base parameters. Embarrassingly parallel,
+    so big blocks are sharded across a process pool (like
+    calibrate_nss_panel_parallel); shocks are drawn by the caller, so
+    results are deterministic for a fixed seed regardless of worker
+    count. Falls back to serial when the instrument does not pickle.
+    """
+    import pickle
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+
+    chunk_size = 512
+    chunks = [shocked_matrix[s:s + chunk_size] for s in range(0, len(shocked_matrix), chunk_size)]
+
+    parallel = len(chunks) > 1
+    if parallel:
+        try:
+            pickle.dumps(bond)
+        except Exception:
+            parallel = False
+
+    if not parallel:
+        return _reprice_chunk(
+            bond, tenors, shocked_matrix, settlement_date, x0_base, base_price
+        )
+
+    with ProcessPoolExecutor() as ex:
+        results = list(ex.map(
+            _reprice_chunk,
+            repeat(bond), repeat(tenors), chunks,
+            repeat(settlement_date), repeat(x0_base), repeat(base_price),
+        ))
+    return np.concatenate(results)
+
+
+def compute_monte_carlo_var_with_settlement(
+    bond,
+    yield_df,
+    settlement_date,
+    *,
+    base_date=None,
+    tenors: Optional[Sequence[str]] = None,
+    lookback_days: int = 252,
+    n_sims: int = 5000,
+    seed: int = 42,
+    confidence_levels: Sequence[float] = (0.95, 0.99),
+    sim_chunk_size: int = 65536,
+    bit_generator: str = "PCG64DXSM",
+) -> MonteCarloVaRResult:
+    """
+    Monte Carlo VaR using full revaluation:
+
+    1) Estimate covariance matrix of daily tenor changes from history.
+    2) Simulate multivariate normal yield shocks.
+    3) Apply shocks to the base curve snapshot.
+    4) Re-solve NSS betas for ALL simulations in one batched linear
+       system (taus fixed at the base-date fit) and reprice the bond
+       against every simulated curve in one matmul.
+    5) Compute VaR from the simulated P&L distribution.
+
+    VaR reported as a positive number (loss magnitude).
+
+    Shocks are generated and revalued in blocks of sim_chunk_size, so
+    very large n_sims never materialize the full (n_sims, n_tenors)
+    shock matrix - only the P&L vector persists. Chunked draws read the
+    generator stream sequentially, so for a given seed the simulated
+    shocks are identical at any chunk size (P&L matches up to BLAS
+    rounding in the batched matmuls).
+    """
+    if tenors is None:
+        tenors = DEFAULT_VAR_TENORS
+
+    tenors = list(normalize_and_sort_tenors(tuple(tenors)))
+
+    missing = [t for t in tenors if t not in yield_df.columns]
+    if missing:
+        raise ValueError(f"Yield DataFrame missing required tenors: {missing}")
+
+    if base_date is None:
+        base_date = yield_df.index.max()
+
+    # History statistics (window slice, daily changes, covariance,
+    # Cholesky factor) are cached per (frame, tenors, base_date,
+    # lookback): running VaR on many instruments against one history
+    # re-runs only the pricing stage.
+    base_vec, changes, _, L = _history_stats(
+        yield_df, tuple(tenors), base_date, lookback_days
+    )
+
+    # Base fit and price (memoized across the risk entry points). The
+    # base betas ARE the linear LS solution at the fitted taus, so the
+    # batched solve below is exactly consistent with this baseline.
+    params_base, _ = calibrate_nss_cached(tuple(tenors), tuple(base_vec.tolist()))
+    curve_base = NSSCurve.from_params(params_base)
+    base_price = float(bond.price(curve_base, settlement_date=settlement_date))
+
+    # Cholesky-drawn shocks: standard normals times L.T is ~3x cheaper
+    # than multivariate_normal's per-call SVD and needs no mean vector.
+    #
+    # Bit generator is selectable by name; the PCG64DXSM default has a
+    # stronger output mixer than plain PCG64 at the same speed, and both
+    # it and Philox support jumped()/advance() for independent substreams
+    # should the simulation loop ever be sharded across workers.
+    bg_cls = getattr(np.random, bit_generator, None)
+    if not (isinstance(bg_cls, type) and issubclass(bg_cls, np.random.BitGenerator)):
+        raise ValueError(
+            f"Unknown bit generator: {bit_generator!r} "
+            "(expected the name of a np.random.BitGenerator subclass, "
+            "e.g. 'PCG64DXSM', 'PCG64', 'Philox')."
+        )
+    rng = np.random.Generator(bg_cls(seed))
+    n_sims = int(n_sims)
+    n_tenors = len(tenors)
+    x0_base = params_base.as_array()
+
+    pnl = np.empty(n_sims, dtype=float)
+    for start in range(0, n_sims, int(sim_chunk_size)):
+        k = min(int(sim_chunk_size), n_sims - start)
+        shocked = base_vec[None, :] + rng.standard_normal((k, n_tenors)) @ L.T
+        res = _batched_pnl(bond, settlement_date, tenors, shocked, params_base, base_price)
+        if res is None:
+            res = _fallback_pnl(bond, tenors, shocked, settlement_date, x0_base, base_price)
+        pnl[start:start + k] = res
+
+    var_by_level = _var_from_pnl(pnl, confidence_levels)
+
+    return MonteCarloVaRResult(
+        base_price=base_price,
+        base_date=base_date,
+        settlement_date=settlement_date,
+        tenors=list(tenors),
+        lookback_days=int(changes.shape[0]),
+        n_sims=int(n_sims),
+        seed=int(seed),
+        pnl=pnl,
+        var_by_level=var_by_level,
+    )
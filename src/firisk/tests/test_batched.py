@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from firisk.curve.calibration import calibrate_nss, calibrate_nss_batch, calibrate_nss_cached
+from firisk.curve.curve_object import NSSCurve
+from firisk.data.loaders import load_yield_history
+from firisk.instruments.bond import FixedCouponBond
+from firisk.risk._batched import var_from_pnl
+from firisk.risk._history import history_stats
+from firisk.risk.var_historical import compute_historical_var_with_settlement
+
+ROOT = Path(__file__).resolve().parents[3]  # project root
+YIELDS_CSV = ROOT / "src" / "firisk" / "data" / "yields.csv"
+
+
+def test_var_from_pnl_matches_quantile():
+    rng = np.random.default_rng(7)
+    pnl = rng.normal(0.0, 1.0, size=1001)
+
+    out = var_from_pnl(pnl, (0.90, 0.95, 0.99))
+
+    for cl in (0.90, 0.95, 0.99):
+        q = float(np.quantile(pnl, 1.0 - cl))
+        assert abs(out[cl] - max(0.0, -q)) < 1e-12
+
+
+def test_history_stats_matches_direct_computation():
+    df = load_yield_history(YIELDS_CSV)
+    tenors = tuple(df.columns)
+    base = df.index.max()
+
+    base_vec, changes, cov, L = history_stats(df, tenors, base, 60)
+
+    arr = df.loc[:base, list(tenors)].to_numpy(dtype=float)[-61:]
+    assert np.allclose(base_vec, arr[-1])
+    assert np.allclose(changes, np.diff(arr, axis=0))
+    assert np.allclose(cov, np.cov(changes, rowvar=False), atol=1e-10)
+    assert np.allclose(L @ L.T, cov, atol=1e-10)
+
+
+def test_batched_historical_var_close_to_full_refit():
+    # The batched path holds (tau1, tau2) at the base-date fit and solves
+    # the scenario betas linearly; daily-change-sized shocks keep the
+    # approximation within a few percent of full refits on real data.
+    df = load_yield_history(YIELDS_CSV)
+    tenors = list(df.columns)
+    base = df.index.max()
+    bond = FixedCouponBond(maturity_date=pd.Timestamp("2031-06-15"), coupon_rate=0.04)
+
+    res = compute_historical_var_with_settlement(
+        bond, df, settlement_date=base, base_date=base, lookback_days=60
+    )
+
+    base_vec, changes, _, _ = history_stats(df, tuple(tenors), base, 60)
+    params_base, _ = calibrate_nss_cached(tuple(tenors), tuple(base_vec.tolist()))
+    x0 = params_base.as_array()
+    base_price = bond.price(NSSCurve.from_params(params_base), settlement_date=base)
+
+    shocked = base_vec[None, :] + changes
+    pnl_ref = np.empty(len(shocked))
+    for i, row in enumerate(shocked):
+        p, _ = calibrate_nss(tenors, row, initial_guess=x0)
+        pnl_ref[i] = bond.price(NSSCurve.from_params(p), settlement_date=base) - base_price
+    ref = var_from_pnl(pnl_ref, (0.95, 0.99))
+
+    for cl in (0.95, 0.99):
+        assert abs(res.var_by_level[cl] - ref[cl]) < 0.20 * ref[cl]
+
+
+def test_calibrate_nss_batch_matches_single_fits():
+    df = load_yield_history(YIELDS_CSV)
+    tenors = list(df.columns)
+    rows = df.to_numpy(dtype=float)[-3:]
+
+    batch = calibrate_nss_batch(tenors, rows)
+
+    for row, (params, stats) in zip(rows, batch):
+        p_single, s_single = calibrate_nss(tenors, row)
+        assert np.allclose(params.as_array(), p_single.as_array(), atol=1e-8)
+        assert abs(stats.rmse - s_single.rmse) < 1e-10
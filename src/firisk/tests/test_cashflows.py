@@ -1,5 +1,9 @@
 import pandas as pd
-from firisk.instruments.cashflows import build_coupon_schedule, generate_fixed_coupon_cashflows
+from firisk.instruments.cashflows import (
+    build_coupon_schedule,
+    cashflow_arrays,
+    generate_fixed_coupon_cashflows,
+)
 
 
 def test_schedule_includes_maturity():
@@ -20,3 +24,19 @@ def test_cashflows_include_principal_at_maturity():
     )
 
     assert any(cf.date == maturity and cf.amount > 100 for cf in cfs)
+
+
+def test_cashflow_arrays_matches_schedule_builder():
+    settle = pd.Timestamp("2020-01-01")
+    maturity = pd.Timestamp("2025-01-01")
+
+    dates_ns, amounts = cashflow_arrays(
+        settle.value, maturity.value, coupon_rate=0.05, notional=100, frequency=2
+    )
+    cfs = generate_fixed_coupon_cashflows(
+        settle, maturity, coupon_rate=0.05, notional=100, frequency=2
+    )
+
+    assert len(amounts) == len(cfs)
+    assert list(dates_ns) == [cf.date.value for cf in cfs]
+    assert all(abs(a - cf.amount) < 1e-12 for a, cf in zip(amounts, cfs))
@@ -1,4 +1,10 @@
-from firisk.utils.dates import normalize_tenor, tenor_to_years, sort_tenors
+from firisk.utils.dates import (
+    normalize_and_sort_tenors,
+    normalize_tenor,
+    sort_tenors,
+    tenor_to_years,
+    tenors_to_years_array,
+)
 
 def test_normalize_tenor():
     assert normalize_tenor("3m") == "3M"
@@ -11,3 +17,10 @@ def test_tenor_to_years():
 
 def test_sort_tenors():
     assert sort_tenors(["10Y", "3M", "2Y"]) == ["3M", "2Y", "10Y"]
+
+def test_tenors_to_years_array():
+    arr = tenors_to_years_array(("3M", "1Y", "10Y"))
+    assert list(arr) == [0.25, 1.0, 10.0]
+
+def test_normalize_and_sort_tenors():
+    assert normalize_and_sort_tenors(("10y", "3m", "2Y")) == ("3M", "2Y", "10Y")
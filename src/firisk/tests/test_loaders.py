@@ -0,0 +1,13 @@
+from pathlib import Path
+
+from firisk.data.loaders import load_yield_history
+
+ROOT = Path(__file__).resolve().parents[3]  # project root
+YIELDS_CSV = ROOT / "src" / "firisk" / "data" / "yields.csv"
+
+
+def test_chunked_load_matches_plain():
+    plain = load_yield_history(YIELDS_CSV)
+    chunked = load_yield_history(YIELDS_CSV, chunksize=1000)
+
+    assert chunked.equals(plain)
@@ -49,3 +49,44 @@ def test_portfolio_price_matches_sum_of_positions():
 
     assert np.isfinite(pv_port)
     assert abs(pv_port - pv_manual) < 1e-6
+
+
+def test_portfolio_reprices_after_direct_mutation():
+    yields = _sample_yields()
+    tenors = list(yields.keys())
+    params, _ = calibrate_nss(tenors, [yields[t] for t in tenors])
+    curve = NSSCurve.from_params(params)
+    settle = pd.Timestamp("2022-12-30")
+
+    bond1 = FixedCouponBond(pd.Timestamp("2028-01-01"), 0.04)
+    bond2 = FixedCouponBond(pd.Timestamp("2032-01-01"), 0.05)
+
+    # Mutate the public list directly instead of going through add()
+    portfolio = Portfolio([Position(bond1, 1.0)])
+    portfolio.positions.append(Position(bond2, 2.0))
+    portfolio.positions[0] = Position(bond1, 5.0)
+
+    expected = Portfolio([
+        Position(bond1, 5.0),
+        Position(bond2, 2.0),
+    ]).price(curve, settlement_date=settle)
+
+    assert abs(portfolio.price(curve, settlement_date=settle) - expected) < 1e-9
+
+
+def test_portfolio_cashflow_arrays_reprice_to_portfolio_price():
+    yields = _sample_yields()
+    tenors = list(yields.keys())
+    params, _ = calibrate_nss(tenors, [yields[t] for t in tenors])
+    curve = NSSCurve.from_params(params)
+    settle = pd.Timestamp("2022-12-30")
+
+    portfolio = Portfolio([
+        Position(FixedCouponBond(pd.Timestamp("2028-01-01"), 0.04), 2.0),
+        Position(FixedCouponBond(pd.Timestamp("2032-01-01"), 0.05), 3.0),
+    ])
+
+    t, amounts = portfolio.cashflow_arrays(settle)
+    pv_arrays = float(amounts @ curve.discount_factor(t))
+
+    assert abs(pv_arrays - portfolio.price(curve, settlement_date=settle)) < 1e-9
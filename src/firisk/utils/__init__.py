@@ -1,23 +1,29 @@
-# src/firisk/utils/__init__.py
-
-"""
-Shared utility functions used across the toolkit.
-
-Includes:
-- Tenor parsing/conversion
-- Date-related helpers
-"""
-
-from .dates import (
-    normalize_tenor,
-    sort_tenors,
-    tenor_to_years,
-    year_fraction_act365,
-)
-
-__all__ = [
-    "normalize_tenor",
-    "sort_tenors",
-    "tenor_to_years",
-    "year_fraction_act365",
-]
+# src/firisk/utils/__init__.py
+
+"""
+Shared utility functions used across the toolkit.
+
+Includes:
+- Tenor parsing/conversion
+- Date-related helpers
+"""
+
+from .dates import (
+    normalize_and_sort_tenors,
+    normalize_tenor,
+    sort_tenors,
+    tenor_to_years,
+    tenors_to_years_array,
+    year_fraction_act_365,
+    year_fraction_act_365_array,
+)
+
+__all__ = [
+    "normalize_and_sort_tenors",
+    "normalize_tenor",
+    "sort_tenors",
+    "tenor_to_years",
+    "tenors_to_years_array",
+    "year_fraction_act_365",
+    "year_fraction_act_365_array",
+]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
 import re
+import sys
 from dataclasses import dataclass
 from typing import Iterable, List, Sequence, Tuple, Union, Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -12,8 +15,12 @@ import pandas as pd
 # ----------------------------
 
 _TENOR_RE = re.compile(r"^\s*(\d+)\s*([MmYy])\s*$")
+# Bound method hoisted to module scope: saves the global + attribute
+# lookup per call in tight normalization loops.
+_tenor_match = _TENOR_RE.match
 
 
+@functools.lru_cache(maxsize=512)
 def normalize_tenor(tenor: str) -> str:
     """
     Normalize a tenor string to canonical form.
@@ -23,14 +30,32 @@ def normalize_tenor(tenor: str) -> str:
         " 10Y " -> "10Y"
     """
     t = tenor.strip()
-    m = _TENOR_RE.match(t)
+
+    # Fast path: the grammar is just digits + unit, so slicing plus int()
+    # beats building a Match object for these tiny inputs. isdigit()
+    # keeps the same strictness as the regex (no signs or underscores);
+    # the regex remains as the fallback for interior whitespace.
+    unit = t[-1:].upper()
+    if unit in ("M", "Y") and t[:-1].isdigit():
+        # Interned so every spelling of a tenor shares one canonical str
+        # object: downstream set/dict membership and column comparisons
+        # short-circuit on identity instead of comparing characters.
+        return sys.intern(f"{int(t[:-1])}{unit}")
+
+    m = _tenor_match(t)
     if not m:
         raise ValueError(f"Invalid tenor format: '{tenor}' (expected like '3M', '1Y').")
     n = int(m.group(1))
     unit = m.group(2).upper()
-    return f"{n}{unit}"
+    return sys.intern(f"{n}{unit}")
+
 
+# Unit divisors for tenor_to_years: one hashed lookup replaces the
+# M/Y comparison chain, and normalize_tenor guarantees the key exists.
+_UNIT_DIV = {"M": 12.0, "Y": 1.0}
 
+
+@functools.lru_cache(maxsize=512)
 def tenor_to_years(tenor: str) -> float:
     """
     Convert a tenor string into a year fraction.
@@ -40,28 +65,50 @@ def tenor_to_years(tenor: str) -> float:
         Y => years  => n
     """
     t = normalize_tenor(tenor)
-    n = int(t[:-1])
-    unit = t[-1]
+    return int(t[:-1]) / _UNIT_DIV[t[-1]]
 
-    if unit == "M":
-        return n / 12.0
-    if unit == "Y":
-        return float(n)
 
-    # Should never reach here due to regex
-    raise ValueError(f"Unsupported tenor unit in '{tenor}'.")
+@functools.lru_cache(maxsize=512)
+def tenors_to_years_array(tenors: Tuple[str, ...]) -> np.ndarray:
+    """
+    Cached year-fraction array for a tuple of tenor strings.
+
+    The same small tenor tuples are converted over and over in pricing and
+    risk loops, so the resulting array is memoized. It is returned
+    read-only; copy (or index, which copies) before mutating.
+    """
+    arr = np.array([tenor_to_years(t) for t in tenors], dtype=float)
+    arr.setflags(write=False)
+    return arr
 
 
-def sort_tenors(tenors: Iterable[str]) -> List[str]:
+def sort_tenors(tenors: Iterable[str], *, already_normalized: bool = False) -> List[str]:
     """
     Sort tenor strings by ascending maturity.
 
-    Returns normalized tenors.
+    Returns normalized tenors. Callers that have already normalized
+    (e.g. enforce_tenor_order) pass already_normalized=True to skip the
+    redundant pass.
     """
-    normed = [normalize_tenor(t) for t in tenors]
+    if already_normalized:
+        normed = list(tenors)
+    else:
+        normed = [normalize_tenor(t) for t in tenors]
     return sorted(normed, key=tenor_to_years)
 
 
+@functools.lru_cache(maxsize=64)
+def normalize_and_sort_tenors(tenors: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Cached normalize-then-sort for a tuple of tenor strings.
+
+    The risk entry points normalize and sort the same canonical tenor set
+    on every call (per bump, per scenario, per simulation), so the result
+    is memoized per input tuple like the other tenor caches above.
+    """
+    return tuple(sort_tenors(tenors))
+
+
 def enforce_tenor_order(
     columns: Sequence[str],
     required: Optional[Sequence[str]] = None
@@ -85,11 +132,12 @@ def enforce_tenor_order(
 
     if required is not None:
         req_norm = [normalize_tenor(r) for r in required]
-        missing = [r for r in req_norm if r not in norm_cols]
+        norm_cols_set = set(norm_cols)
+        missing = [r for r in req_norm if r not in norm_cols_set]
         if missing:
             raise ValueError(f"Missing required tenor columns: {missing}")
 
-    return sort_tenors(norm_cols)
+    return sort_tenors(norm_cols, already_normalized=True)
 
 
 # ----------------------------
@@ -98,7 +146,8 @@ def enforce_tenor_order(
 
 def to_datetime_index(
     df: pd.DataFrame,
-    date_col: str = "date"
+    date_col: str = "date",
+    date_format: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Ensure df is indexed by a DatetimeIndex.
@@ -107,33 +156,105 @@ def to_datetime_index(
         - existing DatetimeIndex
         - a date column containing parseable strings
 
-    Returns a copy.
-    """
-    out = df.copy()
+    date_format, when known, is forwarded to pd.to_datetime so parsing
+    stays on the vectorized C path; otherwise the ISO-8601 fast path is
+    tried before falling back to per-element format inference.
 
-    if isinstance(out.index, pd.DatetimeIndex):
-        return out
+    Returns the input unchanged when it is already datetime-indexed
+    (nothing to do, so no full-frame copy); otherwise a new frame.
+    """
+    if isinstance(df.index, pd.DatetimeIndex):
+        return df
+
+    cols = df.columns
+    if date_col not in cols and "Date" in cols:
+        # rename already returns a new frame; no separate copy needed.
+        out = df.rename(columns={"Date": date_col})
+    elif date_col in cols:
+        out = df.copy()
+    else:
+        raise ValueError(f"Expected a '{date_col}' or 'Date' column.")
 
-    if date_col not in out.columns and "Date" in out.columns:
-        out = out.rename(columns={"Date": date_col})
+    # errors="raise" on the happy path: clean data parses in a single
+    # pass with no mandatory NaT re-scan. Only on failure is the column
+    # re-parsed with errors="coerce" to collect the offending raw values
+    # for the error message. cache=True memoizes unique strings.
+    raw = out[date_col]
+    if pd.api.types.is_datetime64_any_dtype(raw):
+        # Already typed (parquet round-trips, upstream preprocessing):
+        # skip the parse entirely.
+        parsed = raw
+    else:
+        try:
+            if date_format is not None:
+                parsed = pd.to_datetime(raw, format=date_format, cache=True)
+            else:
+                try:
+                    parsed = pd.to_datetime(raw, format="ISO8601", cache=True)
+                except (ValueError, TypeError):
+                    parsed = pd.to_datetime(raw, cache=True)
+        except (ValueError, TypeError):
+            coerced = pd.to_datetime(raw, format=date_format, errors="coerce", cache=True)
+            bad = raw[coerced.isna()].head(10).tolist()
+            raise ValueError(f"Unparseable dates. Examples: {bad}")
+
+    # Attach the parsed values as the index directly instead of writing
+    # the column back and re-extracting it through set_index - one
+    # block-manager touch instead of three (out is a private copy, so
+    # the in-place delete is safe).
+    del out[date_col]
+    out.index = pd.DatetimeIndex(parsed)
+
+    # Time-series files are typically already chronological; the O(N)
+    # monotonicity scan is much cheaper than an unconditional sort.
+    if not out.index.is_monotonic_increasing:
+        out = out.sort_index()
+    return out
 
-    if date_col not in out.columns:
-        raise ValueError(f"Expected a '{date_col}' or 'Date' column.")
 
-    out[date_col] = pd.to_datetime(out[date_col], errors="coerce")
-    if out[date_col].isna().any():
-        bad = out.loc[out[date_col].isna(), date_col].head(10).tolist()
-        raise ValueError(f"Unparseable dates. Examples: {bad}")
+def strings_to_period_index(strings, freq: str) -> pd.PeriodIndex:
+    """
+    Build a PeriodIndex from date strings via the DatetimeIndex fast path.
 
-    out = out.set_index(date_col).sort_index()
-    return out
+    pd.PeriodIndex(strings, freq=...) constructs Period objects one by
+    one in Python; parsing to a DatetimeIndex first and converting with
+    to_period stays on the vectorized tslibs path and is orders of
+    magnitude faster for large inputs. Prefer this helper over calling
+    pd.PeriodIndex on strings directly.
+    """
+    return pd.DatetimeIndex(strings).to_period(freq)
 
 
 def year_fraction_act_365(start: Union[str, pd.Timestamp], end: Union[str, pd.Timestamp]) -> float:
     """
     ACT/365 year fraction.
     """
+    # Already-typed inputs skip the Timestamp constructor (tz/calendar
+    # validation) for a pure C datetime64 day subtract. Dates in this
+    # toolkit are date-resolution, so flooring each side to days agrees
+    # with the Timestamp path.
+    if isinstance(start, (pd.Timestamp, np.datetime64)) and isinstance(
+        end, (pd.Timestamp, np.datetime64)
+    ):
+        s = np.datetime64(start, "D")
+        e = np.datetime64(end, "D")
+        return float((e - s).astype(np.int64)) / 365.0
+
     s = pd.Timestamp(start)
     e = pd.Timestamp(end)
     delta_days = (e - s).days
     return delta_days / 365.0
+
+
+def year_fraction_act_365_array(starts, ends) -> np.ndarray:
+    """
+    Vectorized ACT/365 year fractions.
+
+    Accepts array-likes of dates (strings, datetime64, DatetimeIndex)
+    and computes all fractions with one C-level subtract on int64 day
+    buffers - callers looping over many dates should use this instead
+    of calling the scalar version per element.
+    """
+    s = np.asarray(starts, dtype="datetime64[D]")
+    e = np.asarray(ends, dtype="datetime64[D]")
+    return (e - s).astype(np.int64) / 365.0